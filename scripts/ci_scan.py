@@ -29,7 +29,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from ss360.scanner import Scanner  # noqa: E402
-from ss360.sarif.export import build_sarif  # noqa: E402
+from ss360.sarif.export import dump_sarif  # noqa: E402
 from ss360.validate.core import run_validators  # noqa: E402
 from ss360.classify import classify  # noqa: E402
 
@@ -439,10 +439,7 @@ def main() -> int:
 
     # Write SARIF (before gating) if requested
     if args.sarif_out:
-        sarif = build_sarif(report)
-        sarif_path = Path(args.sarif_out)
-        sarif_path.parent.mkdir(parents=True, exist_ok=True)
-        sarif_path.write_text(json.dumps(sarif, indent=2))
+        sarif_path = dump_sarif(report, args.sarif_out)
         print(f"[ci-scan] Wrote SARIF: {sarif_path}")
 
     print(f"[ci-scan] total findings: {report['total']}")
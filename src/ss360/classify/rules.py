@@ -16,6 +16,29 @@ from urllib.parse import parse_qs, urlparse
 
 FindingCategory = Literal["actual", "expired", "test", "unknown"]
 
+# Path-based test markers, in priority order
+_TEST_PATH_PATTERNS = tuple(
+    (pattern, re.compile(pattern))
+    for pattern in (
+        r"tests?/",
+        r"fixtures?/",
+        r"examples?/",
+        r"samples?/",
+        r"mocks?/",
+        r"demos?/",
+        r"/run_tests\.py$",
+        r"test_.*\.py$",
+        r".*_test\.py$",
+        r"spec/",
+        r"__tests__/",
+    )
+)
+# Any-of prefilter; a leading ".*" changes nothing for search() but makes the
+# alternation retry it at every offset, so it is dropped here
+_TEST_PATH_RE = re.compile(
+    "|".join(f"(?:{pattern.removeprefix('.*')})" for pattern, _ in _TEST_PATH_PATTERNS)
+)
+
 
 def classify(
     finding: Dict[str, Any], context: Optional[Dict[str, Any]] = None
@@ -135,25 +158,14 @@ def _check_test_markers(
     reasons = []
 
     # Path-based markers (high confidence)
-    test_path_patterns = [
-        r"tests?/",
-        r"fixtures?/",
-        r"examples?/",
-        r"samples?/",
-        r"mocks?/",
-        r"demos?/",
-        r"/run_tests\.py$",
-        r"test_.*\.py$",
-        r".*_test\.py$",
-        r"spec/",
-        r"__tests__/",
-    ]
-
     path_lower = path.lower()
-    for pattern in test_path_patterns:
-        if re.search(pattern, path_lower):
-            reasons.append(f"path:{pattern}")
-            return ("test", 0.9, reasons)
+    # Most paths match none of the patterns; one combined search rules them
+    # all out, and the ordered loop only runs to name the first that matched
+    if _TEST_PATH_RE.search(path_lower):
+        for pattern, compiled in _TEST_PATH_PATTERNS:
+            if compiled.search(path_lower):
+                reasons.append(f"path:{pattern}")
+                return ("test", 0.9, reasons)
 
     # Filename markers (high confidence)
     filename = path.split("/")[-1].lower() if path else ""
@@ -297,8 +309,8 @@ def _extract_jwt_expiry(token: str) -> Optional[datetime]:
 
         # Decode payload (second part)
         payload = parts[1]
-        # Add padding if needed
-        payload += "=" * (4 - len(payload) % 4)
+        # Add padding if needed (none when already a multiple of 4)
+        payload += "=" * (-len(payload) % 4)
 
         decoded = base64.b64decode(payload, validate=True)
         data = json.loads(decoded)
@@ -14,7 +14,6 @@ Compatibility flags accepted (no-ops today):
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 import subprocess
@@ -91,6 +90,12 @@ def main(argv=None):
         choices=["actual", "expired", "test", "unknown"],
         help="only include findings of this category in results",
     )
+    sp.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes for scanning files (default: CPU count; 1 disables)",
+    )
 
     # Add org command with subcommands
     org_parser = sub.add_parser("org", help="organization-level operations")
@@ -152,8 +157,8 @@ def main(argv=None):
 
     if args.cmd == "scan":
         # Use direct scanning instead of shelling out to ci_scan.py
-        from ss360.scanner.direct import scan_with_policy_and_classification
-        from ss360.sarif.export import build_sarif
+        from ss360.scanner.direct import scan_with_policy_and_classification, serialize_findings
+        from ss360.sarif.export import dump_sarif
         from ss360.core.exceptions import SS360ConfigError
         
         try:
@@ -180,12 +185,13 @@ def main(argv=None):
                 scanner_config_path=args.config,
                 only_category=args.only_category,
                 raw_mode=args.raw,
+                num_workers=args.workers,
             )
             
             # Write JSON output
             json_output = Path(args.json_out)
             json_output.parent.mkdir(parents=True, exist_ok=True)
-            json_output.write_text(json.dumps(result, indent=2))
+            json_output.write_bytes(serialize_findings(result))
             print(f"[ss360] Wrote report: {json_output}")
             
             # Print category summary
@@ -197,10 +203,7 @@ def main(argv=None):
                 sarif_out = "findings.sarif"
                 
             if sarif_out:
-                sarif = build_sarif(result)
-                sarif_path = Path(sarif_out)
-                sarif_path.parent.mkdir(parents=True, exist_ok=True)
-                sarif_path.write_text(json.dumps(sarif, indent=2))
+                sarif_path = dump_sarif(result, sarif_out)
                 print(f"[ss360] Wrote SARIF: {sarif_path}")
             
             print(f"[ss360] Total findings: {result['total']}")
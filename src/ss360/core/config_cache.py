@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: MIT
+"""
+Parsed config file cache for SS360.
+
+Config files are re-read on every scan (and several times per scan by the
+policy and validator setup). Parsed documents are cached by
+(resolved path, mtime, size) so unchanged files skip both the disk read and
+the YAML parse; editing a file changes its key and invalidates the entry.
+"""
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Tuple
+
+_CFG_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+
+def load_cached(config_path: str | Path, parse: Callable[[IO[str]], Any]) -> Any:
+    """
+    Parse a config file, reusing the previous result if the file is unchanged.
+
+    Args:
+        config_path: Path to the config file
+        parse: Function parsing an open text file into a document
+
+    Returns:
+        A deep copy of the parsed document, safe for callers to mutate
+    """
+    path = Path(config_path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+
+    if key not in _CFG_CACHE:
+        with open(path, "r", encoding="utf-8") as f:
+            _CFG_CACHE[key] = parse(f)
+
+    # Callers apply defaults in place, so never hand out the cached object
+    return copy.deepcopy(_CFG_CACHE[key])
+
+
+def clear_config_cache() -> None:
+    """Drop all cached config documents."""
+    _CFG_CACHE.clear()
@@ -1,9 +1,13 @@
 """Finding data structures and utilities for Secret Scan 360."""
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+# Keys used for dict lookups against module-level tables during scoring/export
+_INTERNED_KEYS = ("id", "kind", "category")
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -53,6 +57,30 @@ class Finding:
             result["reason"] = self.reason
             
         if self.meta:
-            result["meta"] = self.meta
+            meta = self.meta
+            # Unredacted secrets travel outside meta so they cannot leak into
+            # reports with it; only classification reads "_raw_secret"
+            if "full_token" in meta or "full_url" in meta:
+                meta = dict(meta)
+                full_token = meta.pop("full_token", None)
+                full_url = meta.pop("full_url", None)
+                result["_raw_secret"] = full_token if full_token is not None else full_url
+            result["meta"] = meta
             
-        return result
\ No newline at end of file
+        return result
+
+
+def intern_finding_keys(finding: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern the rule id, kind and category strings of a finding dict in place.
+
+    Strings that came from parsed JSON/YAML (e.g. legacy scanner kinds) are
+    fresh objects; interning them once classification has set the category
+    lets lookups against the interned constant tables used by policy
+    enforcement and SARIF export hit on identity instead of comparing text.
+    """
+    for key in _INTERNED_KEYS:
+        value = finding.get(key)
+        if type(value) is str:
+            finding[key] = sys.intern(value)
+    return finding
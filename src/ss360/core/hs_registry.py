@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: MIT
+"""
+Optional Hyperscan/Vectorscan prefilter for the detector registry.
+
+Every detector's regex patterns are compiled into a single multi-pattern
+database so a blob is walked once. Only detectors with at least one hit
+run their own ``scan()``, which keeps line numbers, redaction and meta
+handling in the detector modules. Without the ``hyperscan`` package the
+registry runs every detector as before.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Dict, List, Set
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+
+def module_patterns(module) -> List[re.Pattern]:
+    """Collect the compiled regex patterns a detector module defines."""
+    patterns = []
+    for value in vars(module).values():
+        if isinstance(value, re.Pattern):
+            patterns.append(value)
+        elif isinstance(value, (list, tuple)):
+            patterns.extend(v for v in value if isinstance(v, re.Pattern))
+    return patterns
+
+
+def _hs_flags(pattern: re.Pattern) -> int:
+    """Translate ``re`` flags into Hyperscan compile flags."""
+    # PREFILTER lets Hyperscan approximate constructs it can't match exactly;
+    # it may over-report, never under-report, which is all a prefilter needs.
+    flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+    if pattern.flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    if pattern.flags & re.DOTALL:
+        flags |= hyperscan.HS_FLAG_DOTALL
+    if pattern.flags & re.MULTILINE:
+        flags |= hyperscan.HS_FLAG_MULTILINE
+    return flags
+
+
+class HyperscanPrefilter:
+    """One-pass multi-pattern prefilter over all detector patterns."""
+
+    def __init__(self, detector_patterns: Dict[str, List[re.Pattern]]):
+        if not HYPERSCAN_AVAILABLE:
+            raise ImportError("hyperscan module required for the prefilter")
+
+        expressions, ids, flags = [], [], []
+        self._names: List[str] = []
+        # Detectors we have no patterns for must always run
+        self._always_run: Set[str] = set()
+
+        for name, patterns in detector_patterns.items():
+            if not patterns:
+                self._always_run.add(name)
+                continue
+            detector_id = len(self._names)
+            self._names.append(name)
+            for pattern in patterns:
+                expressions.append(pattern.pattern.encode("utf-8"))
+                ids.append(detector_id)
+                flags.append(_hs_flags(pattern))
+
+        self._db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        if expressions:
+            self._db.compile(
+                expressions=expressions,
+                ids=ids,
+                elements=len(expressions),
+                flags=flags,
+            )
+        # Scratch space is per database, so scans must not overlap
+        self._lock = threading.Lock()
+        self._has_patterns = bool(expressions)
+
+    def matching_detectors(self, blob: bytes) -> Set[str]:
+        """Return the names of detectors that may match *blob*."""
+        hits = set(self._always_run)
+        if not self._has_patterns:
+            return hits
+
+        names = self._names
+
+        def on_match(detector_id, start, end, flags, context):
+            hits.add(names[detector_id])
+            return False  # keep scanning for other detectors
+
+        # Detectors decode with errors="ignore"; scan the same bytes they see
+        data = blob.decode(errors="ignore").encode("utf-8")
+        with self._lock:
+            self._db.scan(data, match_event_handler=on_match)
+        return hits
+
+
+def build_prefilter(detector_patterns: Dict[str, List[re.Pattern]]):
+    """Build a prefilter, or return None if Hyperscan is unavailable or fails."""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        return HyperscanPrefilter(detector_patterns)
+    except Exception as e:
+        logging.warning(f"Hyperscan prefilter disabled: {e}")
+        return None
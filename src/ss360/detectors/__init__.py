@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 import sys
+import types
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Mapping, Tuple, Union
 from ss360.core.findings import Finding
 
 
@@ -11,45 +12,76 @@ from ss360.core.findings import Finding
 DetectorScanFunc = Callable[[bytes, str], List[Finding]]
 
 
+# Known detectors that have the scan() interface, keyed by detector NAME
+_DETECTOR_MODULES: Dict[str, str] = {
+    "github_pat": "ss360.detectors.github_pat",
+    "aws_keypair": "ss360.detectors.aws_keypair",
+    "azure_sas": "ss360.detectors.azure_storage_sas",
+    "slack_webhook": "ss360.detectors.slack_webhook",
+    "jwt_generic": "ss360.detectors.jwt_generic",
+    "gcp_service_account_key": "ss360.detectors.gcp_service_account_key",
+}
+
+
 class DetectorRegistry:
     """Registry for detector modules under ss360.detectors/"""
     
     def __init__(self):
-        self._detectors: Dict[str, DetectorScanFunc] = {}
+        # Values start as dotted module names and are swapped for the
+        # module's scan() function the first time the detector is needed.
+        self._detectors: Dict[str, Union[str, DetectorScanFunc]] = {}
+        # Read-only live view handed to callers instead of a fresh copy
+        self._detectors_view = types.MappingProxyType(self._detectors)
+        # Literal anchors per detector: (anchors, ignorecase); detectors
+        # without anchors always run
+        self._anchors: Dict[str, Tuple[Tuple[str, ...], bool]] = {}
+        self._prefilter = None
+        self._prefilter_built = False
         self._load_detectors()
     
     def _load_detectors(self):
-        """Load known detectors that have the scan() interface."""
+        """Register known detectors without importing their modules yet."""
+        self._detectors.update(_DETECTOR_MODULES)
+    
+    def _resolve(self, name: str):
+        """Import the detector module for *name* on first use."""
         import importlib
         import logging
         
-        # List of known detectors that have scan() interface
-        detector_modules = [
-            "github_pat",
-            "aws_keypair", 
-            "azure_storage_sas",
-            "slack_webhook",
-            "jwt_generic",
-            "gcp_service_account_key",
-        ]
+        scan_func = self._detectors.get(name)
+        if not isinstance(scan_func, str):
+            return scan_func
         
-        for module_name in detector_modules:
-            try:
-                # Import from ss360.detectors.module_name
-                module = importlib.import_module(f"ss360.detectors.{module_name}")
-                
-                # Check if it has the new scan() interface
-                if hasattr(module, "scan") and hasattr(module, "NAME"):
-                    self._detectors[module.NAME] = module.scan
-                    
-            except (ImportError, AttributeError) as e:
-                # Log warning but don't crash - skip detectors that can't be imported
-                logging.warning(f"Failed to load detector {module_name}: {e}")
-                continue
+        module_name = scan_func
+        try:
+            module = importlib.import_module(module_name)
+            
+            # Check if it has the new scan() interface
+            if not (hasattr(module, "scan") and hasattr(module, "NAME")):
+                raise AttributeError(f"{module_name} has no scan() interface")
+            
+            anchors = tuple(getattr(module, "ANCHORS", ()))
+            if anchors:
+                self._anchors[name] = (anchors, bool(getattr(module, "ANCHORS_IGNORECASE", False)))
+            
+            self._detectors[name] = module.scan
+            return module.scan
+            
+        except (ImportError, AttributeError) as e:
+            # Log warning but don't crash - drop detectors that can't be imported
+            logging.warning(f"Failed to load detector {module_name}: {e}")
+            self._detectors.pop(name, None)
+            return None
+    
+    def _resolve_all(self):
+        """Import every detector that has not been loaded yet."""
+        for name in list(self._detectors):
+            self._resolve(name)
     
-    def all_detectors(self) -> Dict[str, DetectorScanFunc]:
-        """Return all registered detector scan functions."""
-        return self._detectors.copy()
+    def all_detectors(self) -> Mapping[str, DetectorScanFunc]:
+        """Return a read-only view of all registered detector scan functions."""
+        self._resolve_all()
+        return self._detectors_view
     
     def keys(self):
         """Return detector keys for compatibility with acceptance criteria."""
@@ -57,15 +89,76 @@ class DetectorRegistry:
         
     def scan_with_all(self, blob: bytes, path: str) -> List[Finding]:
         """Run all detectors on the given blob and return all findings."""
-        findings = []
-        for detector_name, scan_func in self._detectors.items():
-            try:
-                detector_findings = scan_func(blob, path)
-                findings.extend(detector_findings)
-            except Exception:
-                # Skip detectors that fail to run
+        detector_names = list(self._detectors)
+        
+        # With Hyperscan available, walk the blob once and only run the
+        # detectors whose patterns hit.
+        prefilter = self._get_prefilter()
+        if prefilter is not None:
+            hits = prefilter.matching_detectors(blob)
+            detector_names = [name for name in detector_names if name in hits]
+        
+        scan_funcs = []
+        text = lowered = None
+        for detector_name in detector_names:
+            scan_func = self._resolve(detector_name)
+            if scan_func is None:
                 continue
-        return findings
+            
+            # Otherwise skip detectors whose required literals are absent.
+            # Anchors are checked on the same decoded text the detectors see.
+            anchors = self._anchors.get(detector_name) if prefilter is None else None
+            if anchors is not None:
+                literals, ignorecase = anchors
+                if text is None:
+                    text = blob.decode(errors="ignore")
+                if ignorecase:
+                    # ASCII text lowercases exactly as re.IGNORECASE folds it;
+                    # non-ASCII text may hide Unicode case variants, so scan it.
+                    if not text.isascii():
+                        scan_funcs.append(scan_func)
+                        continue
+                    if lowered is None:
+                        lowered = text.lower()
+                    haystack = lowered
+                else:
+                    haystack = text
+                if not any(literal in haystack for literal in literals):
+                    continue
+            
+            scan_funcs.append(scan_func)
+        
+        return _run_detectors(scan_funcs, blob, path)
+    
+    def _get_prefilter(self):
+        """Build the optional Hyperscan prefilter on first use."""
+        if not self._prefilter_built:
+            self._prefilter_built = True
+            from ss360.core.hs_registry import HYPERSCAN_AVAILABLE, build_prefilter, module_patterns
+            
+            if HYPERSCAN_AVAILABLE:
+                import importlib
+                
+                self._resolve_all()
+                self._prefilter = build_prefilter(
+                    {
+                        name: module_patterns(importlib.import_module(_DETECTOR_MODULES[name]))
+                        for name in self._detectors
+                    }
+                )
+        return self._prefilter
+
+
+def _run_detectors(scan_funcs: List[DetectorScanFunc], blob: bytes, path: str) -> List[Finding]:
+    """Run detectors serially, skipping any that fail."""
+    findings = []
+    for scan_func in scan_funcs:
+        try:
+            findings.extend(scan_func(blob, path))
+        except Exception:
+            # Skip detectors that fail to run
+            continue
+    return findings
 
 
 # Global registry instance
@@ -80,6 +173,6 @@ def get_detector_registry() -> DetectorRegistry:
     return _registry
 
 
-def all_detectors() -> Dict[str, DetectorScanFunc]:
+def all_detectors() -> Mapping[str, DetectorScanFunc]:
     """Convenience function to get all detectors."""
     return get_detector_registry().all_detectors()
\ No newline at end of file
@@ -6,6 +6,10 @@ from ss360.core.findings import Finding
 NAME = "azure_sas"
 SEVERITY = "high"
 
+# Literals every match contains; the registry skips this detector without them
+ANCHORS = (".blob.core.windows.net",)
+ANCHORS_IGNORECASE = True
+
 # Azure SAS token pattern - matches blob/container SAS URLs with required parameters
 PATTERN = re.compile(
     r"https://[a-zA-Z0-9-]+\.blob\.core\.windows\.net/[^?\s]*\?[^?\s]*sv=[^&\s]*&[^?\s]*se=[^&\s]*&[^?\s]*sr=[^&\s]*&[^?\s]*sp=[^&\s]*&[^?\s]*sig=[A-Za-z0-9%+/=]*",
@@ -7,6 +7,10 @@ from ss360.core.findings import Finding
 NAME = "gcp_service_account_key"
 SEVERITY = "high"
 
+# Literals every match contains; the registry skips this detector without them
+ANCHORS = ("service_account",)
+ANCHORS_IGNORECASE = True
+
 # GCP Service Account JSON key pattern - looks for the typical JSON structure
 PATTERN = re.compile(
     r'\{\s*"type"\s*:\s*"service_account"[^}]*"private_key_id"[^}]*"private_key"[^}]*"client_email"[^}]*\}',
@@ -6,6 +6,9 @@ from ss360.core.findings import Finding
 NAME = "github_pat"
 SEVERITY = "high"
 
+# Literals every match contains; the registry skips this detector without them
+ANCHORS = ("ghp_", "github_pat_")
+
 # Match both:
 #  - classic: ghp_<36 alnum>
 #  - fine-grained: github_pat_<id/variant with underscores> (length varies)
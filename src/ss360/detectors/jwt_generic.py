@@ -9,6 +9,9 @@ from ss360.core.findings import Finding
 NAME = "jwt_generic"
 SEVERITY = "medium"
 
+# Literals every match contains; the registry skips this detector without them
+ANCHORS = ("eyJ",)
+
 # JWT pattern: three base64url-encoded parts separated by dots
 PATTERN = re.compile(
     r"\beyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*\b"
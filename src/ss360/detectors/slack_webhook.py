@@ -6,6 +6,9 @@ from ss360.core.findings import Finding
 NAME = "slack_webhook"
 SEVERITY = "high"
 
+# Literals every match contains; the registry skips this detector without them
+ANCHORS = ("https://hooks.slack.com/services/",)
+
 PATTERN = re.compile(
     r"https://hooks\.slack\.com/services/[A-Z0-9]{9}/[A-Z0-9]{9}/[A-Za-z0-9]{24}"
 )
@@ -4,10 +4,23 @@ Policy configuration loader for SS360.
 """
 from __future__ import annotations
 
-import yaml
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any
 
+from ss360.core.config_cache import load_cached
+
+try:
+    import yaml
+
+    # Prefer the libyaml-backed loader; same safety as SafeLoader
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    YAML_AVAILABLE = True
+except ImportError:
+    yaml = None
+    YAML_LOADER = None
+    YAML_AVAILABLE = False
+
 
 def load_policy_config(config_path: str) -> Dict[str, Any]:
     """
@@ -21,14 +34,17 @@ def load_policy_config(config_path: str) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If config file doesn't exist
+        ImportError: If yaml module is not available
         yaml.YAMLError: If config file is invalid YAML
     """
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Policy config file not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    if not YAML_AVAILABLE:
+        raise ImportError("yaml module required for loading config files")
+
+    config = load_cached(path, partial(yaml.load, Loader=YAML_LOADER))
 
     if config is None:
         config = {}
@@ -4,11 +4,14 @@ Policy enforcement engine.
 """
 from __future__ import annotations
 
-from typing import Dict, Any, List
-from dataclasses import dataclass
+import time
+from itertools import chain
+from typing import Dict, Any, Iterator, List
+from dataclasses import dataclass, field
 from enum import Enum
 
-from .loader import is_waiver_active, get_active_waivers
+from .loader import is_waiver_active, get_waivers_by_rule
+from ..risk.score import calculate_risk_scores
 
 
 class PolicyViolationType(Enum):
@@ -20,7 +23,7 @@ class PolicyViolationType(Enum):
     RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyViolation:
     """A policy violation."""
 
@@ -29,10 +32,10 @@ class PolicyViolation:
     severity: str
     finding_id: str = ""
     path: str = ""
-    details: Dict[str, Any] = None
+    details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyEnforcementResult:
     """Result of policy enforcement."""
 
@@ -64,10 +67,11 @@ class PolicyEnforcer:
             PolicyEnforcementResult with violations and summary
         """
         validation_results = validation_results or {}
-        violations = []
         waivers_applied = []
 
         # Filter findings through active waivers
+        now = time.time()
+        waivers_by_rule = get_waivers_by_rule(self.config, now)
         filtered_findings = []
         for finding in findings:
             finding_path = finding.get("path", "")
@@ -75,8 +79,8 @@ class PolicyEnforcer:
 
             # Check if any waiver applies
             waiver_found = False
-            for waiver in get_active_waivers(self.config):
-                if is_waiver_active(waiver, finding_path, rule_id):
+            for waiver in waivers_by_rule.get(rule_id, ()):
+                if is_waiver_active(waiver, finding_path, rule_id, now):
                     waivers_applied.append(
                         {"finding": f"{rule_id}:{finding_path}", "waiver": waiver}
                     )
@@ -86,19 +90,16 @@ class PolicyEnforcer:
             if not waiver_found:
                 filtered_findings.append(finding)
 
-        # Check budget violations
-        budget_violations = self._check_budget_violations(filtered_findings)
-        violations.extend(budget_violations)
-
-        # Check risk score violations
-        risk_violations = self._check_risk_score_violations(
-            filtered_findings, validation_results
+        # Check budget, risk score and validator configuration violations
+        violations = list(
+            chain(
+                self._check_budget_violations(filtered_findings),
+                self._check_risk_score_violations(
+                    filtered_findings, validation_results
+                ),
+                self._check_validator_violations(validation_results),
+            )
         )
-        violations.extend(risk_violations)
-
-        # Check validator configuration violations
-        validator_violations = self._check_validator_violations(validation_results)
-        violations.extend(validator_violations)
 
         # Calculate summary
         summary = {
@@ -118,25 +119,22 @@ class PolicyEnforcer:
 
     def _check_budget_violations(
         self, findings: List[Dict[str, Any]]
-    ) -> List[PolicyViolation]:
+    ) -> Iterator[PolicyViolation]:
         """Check budget constraint violations."""
-        violations = []
         budgets = self.config.get("budgets", {})
 
         # Check legacy new findings budget (backward compatibility)
         max_new_findings = budgets.get("new_findings", None)
         if max_new_findings is not None and len(findings) > max_new_findings:
-            violations.append(
-                PolicyViolation(
-                    type=PolicyViolationType.BUDGET_EXCEEDED,
-                    message=f"Found {len(findings)} findings, but budget allows max {max_new_findings}",
-                    severity="high",
-                    details={
-                        "found": len(findings),
-                        "allowed": max_new_findings,
-                        "budget_type": "new_findings",
-                    },
-                )
+            yield PolicyViolation(
+                type=PolicyViolationType.BUDGET_EXCEEDED,
+                message=f"Found {len(findings)} findings, but budget allows max {max_new_findings}",
+                severity="high",
+                details={
+                    "found": len(findings),
+                    "allowed": max_new_findings,
+                    "budget_type": "new_findings",
+                },
             )
 
         # Check category-based budgets
@@ -163,68 +161,61 @@ class PolicyEnforcer:
             found_count = category_counts.get(category, 0)
 
             if found_count > budget_limit:
-                violations.append(
-                    PolicyViolation(
-                        type=PolicyViolationType.BUDGET_EXCEEDED,
-                        message=f"Found {found_count} {category} findings, but budget allows max {budget_limit}",
-                        severity="high",
-                        details={
-                            "found": found_count,
-                            "allowed": budget_limit,
-                            "budget_type": budget_key,
-                            "category": category,
-                        },
-                    )
+                yield PolicyViolation(
+                    type=PolicyViolationType.BUDGET_EXCEEDED,
+                    message=f"Found {found_count} {category} findings, but budget allows max {budget_limit}",
+                    severity="high",
+                    details={
+                        "found": found_count,
+                        "allowed": budget_limit,
+                        "budget_type": budget_key,
+                        "category": category,
+                    },
                 )
 
-        return violations
-
     def _check_risk_score_violations(
         self,
         findings: List[Dict[str, Any]],
         validation_results: Dict[str, List[Dict[str, Any]]],
-    ) -> List[PolicyViolation]:
+    ) -> Iterator[PolicyViolation]:
         """Check risk score violations."""
-        violations = []
         budgets = self.config.get("budgets", {})
         max_risk_score = budgets.get(
             "max_risk_score", 999
         )  # High default to focus on category budgets
 
-        for i, finding in enumerate(findings):
-            # Calculate risk score if not already present
-            risk_score = finding.get("risk_score")
-            if risk_score is None:
-                # Import and calculate risk score
-                from ..risk.score import calculate_risk_score
+        get_validation_data = validation_results.get
 
-                validation_data = validation_results.get(str(i), [])
-                risk_score = calculate_risk_score(finding, validation_data)
-                finding["risk_score"] = risk_score
+        # Calculate risk scores for findings that don't have one yet
+        unscored = [i for i, finding in enumerate(findings) if finding.get("risk_score") is None]
+        if unscored:
+            scores = calculate_risk_scores(
+                [findings[i] for i in unscored],
+                [get_validation_data(str(i), []) for i in unscored],
+            )
+            for i, risk_score in zip(unscored, scores):
+                findings[i]["risk_score"] = risk_score
 
+        for finding in findings:
+            risk_score = finding["risk_score"]
             if risk_score > max_risk_score:
-                violations.append(
-                    PolicyViolation(
-                        type=PolicyViolationType.RISK_SCORE_TOO_HIGH,
-                        message=f"Finding has risk score {risk_score}, exceeds limit {max_risk_score}",
-                        severity="high",
-                        finding_id=finding.get("id", ""),
-                        path=finding.get("path", ""),
-                        details={
-                            "risk_score": risk_score,
-                            "max_allowed": max_risk_score,
-                            "finding": finding,
-                        },
-                    )
+                yield PolicyViolation(
+                    type=PolicyViolationType.RISK_SCORE_TOO_HIGH,
+                    message=f"Finding has risk score {risk_score}, exceeds limit {max_risk_score}",
+                    severity="high",
+                    finding_id=finding.get("id", ""),
+                    path=finding.get("path", ""),
+                    details={
+                        "risk_score": risk_score,
+                        "max_allowed": max_risk_score,
+                        "finding": finding,
+                    },
                 )
 
-        return violations
-
     def _check_validator_violations(
         self, validation_results: Dict[str, List[Dict[str, Any]]]
-    ) -> List[PolicyViolation]:
+    ) -> Iterator[PolicyViolation]:
         """Check validator configuration violations."""
-        violations = []
         validators_config = self.config.get("validators", {})
 
         # Check if network validators were disabled when they should be allowed
@@ -242,7 +233,8 @@ class PolicyEnforcer:
             # Not a violation, just note that network validation was skipped
             pass
 
-        return violations
+        # No validator configuration rules produce violations yet
+        yield from ()
 
     def format_violations_report(self, result: PolicyEnforcementResult) -> str:
         """Format policy violations as a human-readable report."""
@@ -4,17 +4,26 @@ Policy configuration loading.
 """
 from __future__ import annotations
 
+import fnmatch
 import os
+import re
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, List
-import fnmatch
+from functools import lru_cache, partial
+from typing import Callable, Dict, Any, List, Optional
+
+from ss360.core.config_cache import load_cached
 
 try:
     import yaml
 
+    # Prefer the libyaml-backed loader; same safety as SafeLoader
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     YAML_AVAILABLE = True
 except ImportError:
     yaml = None
+    YAML_LOADER = None
     YAML_AVAILABLE = False
 
 
@@ -38,8 +47,7 @@ def load_policy_config(config_path: str = None) -> Dict[str, Any]:
         raise ImportError("yaml module required for loading config files")
 
     if os.path.exists(config_path):
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = load_cached(config_path, partial(yaml.load, Loader=YAML_LOADER))
 
         if config is None:
             config = {}
@@ -61,45 +69,18 @@ def load_policy_config(config_path: str = None) -> Dict[str, Any]:
 
 def _apply_policy_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     """Apply default values to policy configuration."""
-    # Set version if missing
-    if "version" not in config:
-        config["version"] = 1
-
-    # Set validators section defaults
-    if "validators" not in config:
-        config["validators"] = {}
-
-    validators = config["validators"]
-    if "allow_network" not in validators:
-        validators["allow_network"] = False  # Default to safe mode
-    if "global_qps" not in validators:
-        validators["global_qps"] = 2.0
-
-    # Set budgets section defaults
-    if "budgets" not in config:
-        config["budgets"] = {}
-
-    budgets = config["budgets"]
-    if "new_findings" not in budgets:
-        budgets["new_findings"] = 0  # Strict by default
-    if "max_risk_score" not in budgets:
-        budgets["max_risk_score"] = 40
-
-    # Set waivers section defaults
-    if "waivers" not in config:
-        config["waivers"] = []
+    return _deep_merge(get_default_policy_config(), config)
 
-    # Set autofix section defaults
-    if "autofix" not in config:
-        config["autofix"] = {}
 
-    autofix = config["autofix"]
-    if "min_risk_score" not in autofix:
-        autofix["min_risk_score"] = 60
-    if "require_confirmation" not in autofix:
-        autofix["require_confirmation"] = True
-
-    return config
+def _deep_merge(base: Dict[str, Any], over: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay *over* on *base*, merging nested dictionaries; base values are reused."""
+    merged = dict(over)
+    for key, value in base.items():
+        if key not in merged:
+            merged[key] = value
+        elif isinstance(value, dict) and isinstance(merged[key], dict):
+            merged[key] = _deep_merge(value, merged[key])
+    return merged
 
 
 def _validate_policy_config(config: Dict[str, Any]) -> None:
@@ -140,12 +121,13 @@ def _validate_waiver(waiver: Dict[str, Any]) -> None:
         if field not in waiver:
             raise ValueError(f"Waiver missing required field: {field}")
 
-    # Validate expiry date format
-    try:
-        datetime.fromisoformat(waiver["expiry"])
-    except ValueError:
+    # Validate expiry date format (parsed once and cached for enforcement)
+    if _parse_expiry(waiver["expiry"]) is None:
         raise ValueError(f"Invalid expiry date format: {waiver['expiry']}")
 
+    # Compile the path glob up front so enforcement only runs the regex
+    _compile_waiver_path(waiver["path"])
+
 
 def get_default_policy_config() -> Dict[str, Any]:
     """
@@ -163,7 +145,27 @@ def get_default_policy_config() -> Dict[str, Any]:
     }
 
 
-def is_waiver_active(waiver: Dict[str, Any], finding_path: str, rule_id: str) -> bool:
+@lru_cache(maxsize=1024)
+def _parse_expiry(expiry_str: str) -> Optional[float]:
+    """Parse a waiver expiry date to a POSIX timestamp; None if invalid."""
+    try:
+        return datetime.fromisoformat(expiry_str).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _compile_waiver_path(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Translate a waiver path glob to a compiled matcher once per pattern."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def is_waiver_active(
+    waiver: Dict[str, Any],
+    finding_path: str,
+    rule_id: str,
+    now: Optional[float] = None,
+) -> bool:
     """
     Check if a waiver is active for a given finding.
 
@@ -171,6 +173,7 @@ def is_waiver_active(waiver: Dict[str, Any], finding_path: str, rule_id: str) ->
         waiver: Waiver configuration
         finding_path: Path of the finding
         rule_id: Rule/detector ID
+        now: Reference POSIX timestamp (defaults to time.time())
 
     Returns:
         True if waiver is active and applicable
@@ -181,42 +184,58 @@ def is_waiver_active(waiver: Dict[str, Any], finding_path: str, rule_id: str) ->
 
     # Check if waiver applies to this path (glob matching)
     waiver_path = waiver.get("path", "")
-    if not fnmatch.fnmatch(finding_path, waiver_path):
+    if not _compile_waiver_path(waiver_path)(os.path.normcase(finding_path)):
         return False
 
     # Check if waiver is still valid (not expired)
-    expiry_str = waiver.get("expiry", "")
-    try:
-        expiry_date = datetime.fromisoformat(expiry_str)
-        if datetime.now() > expiry_date:
-            return False
-    except ValueError:
+    expiry_ts = _parse_expiry(waiver.get("expiry", ""))
+    if expiry_ts is None:
+        return False
+    if (now or time.time()) > expiry_ts:
         return False
 
     return True
 
 
-def get_active_waivers(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_active_waivers(
+    config: Dict[str, Any], now: Optional[float] = None
+) -> List[Dict[str, Any]]:
     """
     Get list of currently active waivers.
 
     Args:
         config: Policy configuration
+        now: Reference POSIX timestamp (defaults to time.time())
 
     Returns:
         List of active waiver entries
     """
-    waivers = config.get("waivers", [])
+    now = now or time.time()
     active_waivers = []
 
-    for waiver in waivers:
-        expiry_str = waiver.get("expiry", "")
-        try:
-            expiry_date = datetime.fromisoformat(expiry_str)
-            if datetime.now() <= expiry_date:
-                active_waivers.append(waiver)
-        except ValueError:
-            # Skip invalid expiry dates
-            continue
+    for waiver in config.get("waivers", []):
+        expiry_ts = _parse_expiry(waiver.get("expiry", ""))
+        # Skip invalid expiry dates
+        if expiry_ts is not None and now <= expiry_ts:
+            active_waivers.append(waiver)
 
     return active_waivers
+
+
+def get_waivers_by_rule(
+    config: Dict[str, Any], now: Optional[float] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group currently active waivers by the rule they apply to.
+
+    Args:
+        config: Policy configuration
+        now: Reference POSIX timestamp (defaults to time.time())
+
+    Returns:
+        Dictionary mapping rule IDs to their active waiver entries
+    """
+    waivers_by_rule = defaultdict(list)
+    for waiver in get_active_waivers(config, now):
+        waivers_by_rule[waiver.get("rule")].append(waiver)
+    return dict(waivers_by_rule)
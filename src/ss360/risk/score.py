@@ -11,7 +11,8 @@ Provides deterministic risk scoring based on:
 """
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 
 
@@ -61,6 +62,27 @@ PATH_RISK_MULTIPLIERS = {
     "docs": 0.3,
 }
 
+# Category multipliers; categories not listed (including "unknown") get 1.0
+CATEGORY_RISK_MULTIPLIERS = {
+    "actual": 1.3,  # Boost actual findings significantly
+    "expired": 0.3,  # Expired credentials are lower risk
+    "test": 0.2,  # Test credentials are very low risk
+}
+
+# History age buckets: over 90 days 1.1, over a year 1.2 (bounds exclusive)
+_HISTORY_AGE_BOUNDS = (90, 365)
+_HISTORY_MODIFIERS = (1.0, 1.1, 1.2)
+
+# Risk level thresholds (inclusive lower bounds), lowest first
+_LEVEL_BOUNDS = (20, 40, 60, 80)
+_LEVELS = (
+    RiskLevel.INFO,
+    RiskLevel.LOW,
+    RiskLevel.MEDIUM,
+    RiskLevel.HIGH,
+    RiskLevel.CRITICAL,
+)
+
 
 def calculate_risk_score(
     finding: Dict[str, Any],
@@ -78,39 +100,76 @@ def calculate_risk_score(
     Returns:
         Risk score between 0-100
     """
+    score, _ = _compute_score_and_factors(finding, validation_results, repo_context)
+    return score
+
+
+def _compute_score_and_factors(
+    finding: Dict[str, Any],
+    validation_results: List[Dict[str, Any]] = None,
+    repo_context: Dict[str, Any] = None,
+) -> Tuple[int, Dict[str, Any]]:
+    """Calculate the risk score and the factors it was built from in one pass."""
     validation_results = validation_results or []
     repo_context = repo_context or {}
 
-    # Base score from finding type
-    finding_id = finding.get("id", "unknown")
-    base_score = BASE_RISK_SCORES.get(finding_id, 50)
+    factors = {
+        # Base score from finding type
+        "base_score": BASE_RISK_SCORES.get(finding.get("id", "unknown"), 50),
+        # Validation state modifier
+        "validation_modifier": _get_validation_modifier(validation_results),
+        # Path context modifier
+        "path_modifier": _get_path_modifier(finding.get("path", "")),
+        # Repository exposure modifier
+        "exposure_modifier": _get_exposure_modifier(repo_context),
+        # Historical presence modifier
+        "history_modifier": _get_history_modifier(finding),
+        # Category modifier - boost actual, downrank expired/test
+        "category_modifier": _get_category_modifier(finding),
+    }
 
-    # Start with base score
-    score = float(base_score)
+    # Start with base score and apply each modifier in turn
+    score = float(factors["base_score"])
+    score *= factors["validation_modifier"]
+    score *= factors["path_modifier"]
+    score *= factors["exposure_modifier"]
+    score *= factors["history_modifier"]
+    score *= factors["category_modifier"]
 
-    # Validation state modifier
-    validation_modifier = _get_validation_modifier(validation_results)
-    score *= validation_modifier
+    # Clamp to 0-100 range
+    return max(0, min(100, int(round(score)))), factors
 
-    # Path context modifier
-    path = finding.get("path", "")
-    path_modifier = _get_path_modifier(path)
-    score *= path_modifier
 
-    # Repository exposure modifier
-    exposure_modifier = _get_exposure_modifier(repo_context)
-    score *= exposure_modifier
+def calculate_risk_scores(
+    findings: List[Dict[str, Any]],
+    validation_results: Optional[List[List[Dict[str, Any]]]] = None,
+    repo_context: Dict[str, Any] = None,
+) -> List[int]:
+    """
+    Calculate risk scores for many findings at once.
+
+    Args:
+        findings: The security findings
+        validation_results: Validation results per finding (same order as findings)
+        repo_context: Repository context information shared by all findings
 
-    # Historical presence modifier
-    history_modifier = _get_history_modifier(finding)
-    score *= history_modifier
+    Returns:
+        Risk scores between 0-100, one per finding
 
-    # Category modifier - boost actual, downrank expired/test
-    category_modifier = _get_category_modifier(finding)
-    score *= category_modifier
+    Raises:
+        ValueError: If validation_results and findings differ in length
+    """
+    if validation_results is None:
+        validation_results = [None] * len(findings)
+    elif len(validation_results) != len(findings):
+        raise ValueError(
+            f"Expected {len(findings)} validation result lists, got {len(validation_results)}"
+        )
 
-    # Clamp to 0-100 range
-    return max(0, min(100, int(round(score))))
+    return [
+        calculate_risk_score(finding, results, repo_context)
+        for finding, results in zip(findings, validation_results)
+    ]
 
 
 def _get_validation_modifier(validation_results: List[Dict[str, Any]]) -> float:
@@ -118,16 +177,18 @@ def _get_validation_modifier(validation_results: List[Dict[str, Any]]) -> float:
     if not validation_results:
         return 1.0  # No validation info
 
-    # Check if any validator confirmed the finding as valid
-    has_valid = any(r.get("state") == "valid" for r in validation_results)
-    has_invalid = any(r.get("state") == "invalid" for r in validation_results)
+    # One pass; a confirmed-valid result outranks everything else
+    has_invalid = False
+    for r in validation_results:
+        state = r.get("state")
+        if state == "valid":
+            return 1.3  # Confirmed valid - higher risk
+        if state == "invalid":
+            has_invalid = True
 
-    if has_valid:
-        return 1.3  # Confirmed valid - higher risk
-    elif has_invalid:
+    if has_invalid:
         return 0.4  # Confirmed invalid - much lower risk
-    else:
-        return 0.9  # Indeterminate - slightly lower risk
+    return 0.9  # Indeterminate - slightly lower risk
 
 
 def _get_path_modifier(path: str) -> float:
@@ -167,43 +228,17 @@ def _get_history_modifier(finding: Dict[str, Any]) -> float:
     # If finding has been in history for a long time, it's potentially higher risk
     # as it may have been exposed/used more
     history_age_days = finding.get("history_age_days", 0)
-
-    if history_age_days > 365:
-        return 1.2  # Over a year old - higher risk
-    elif history_age_days > 90:
-        return 1.1  # Over 3 months old - slightly higher risk
-    else:
-        return 1.0  # Recent or no history info
+    return _HISTORY_MODIFIERS[bisect_left(_HISTORY_AGE_BOUNDS, history_age_days)]
 
 
 def _get_category_modifier(finding: Dict[str, Any]) -> float:
     """Get risk modifier based on finding category."""
-    category = finding.get("category", "unknown")
-
-    if category == "actual":
-        return 1.3  # Boost actual findings significantly
-    elif category == "expired":
-        return 0.3  # Expired credentials are lower risk
-    elif category == "test":
-        return 0.2  # Test credentials are very low risk
-    elif category == "unknown":
-        return 1.0  # No modification for unknown
-    else:
-        return 1.0  # Default for any new categories
+    return CATEGORY_RISK_MULTIPLIERS.get(finding.get("category", "unknown"), 1.0)
 
 
 def get_risk_level(score: int) -> RiskLevel:
     """Convert numeric risk score to risk level."""
-    if score >= 80:
-        return RiskLevel.CRITICAL
-    elif score >= 60:
-        return RiskLevel.HIGH
-    elif score >= 40:
-        return RiskLevel.MEDIUM
-    elif score >= 20:
-        return RiskLevel.LOW
-    else:
-        return RiskLevel.INFO
+    return _LEVELS[bisect_right(_LEVEL_BOUNDS, score)]
 
 
 def risk_summary(
@@ -217,18 +252,11 @@ def risk_summary(
     Returns:
         Dictionary with score, level, and contributing factors
     """
-    score = calculate_risk_score(finding, validation_results, repo_context)
+    score, factors = _compute_score_and_factors(finding, validation_results, repo_context)
     level = get_risk_level(score)
 
     return {
         "score": score,
         "level": level.value,
-        "factors": {
-            "base_score": BASE_RISK_SCORES.get(finding.get("id", "unknown"), 50),
-            "validation_modifier": _get_validation_modifier(validation_results or []),
-            "path_modifier": _get_path_modifier(finding.get("path", "")),
-            "exposure_modifier": _get_exposure_modifier(repo_context or {}),
-            "history_modifier": _get_history_modifier(finding),
-            "category_modifier": _get_category_modifier(finding),
-        },
+        "factors": factors,
     }
@@ -1,95 +1,189 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, List
 
+try:
+    import orjson
 
-def build_sarif(report: Dict[str, Any]) -> Dict[str, Any]:
-    findings = report.get("findings", []) or []
-    root = str(report.get("root", ""))
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-    # Collect rules by 'kind'
-    rule_ids = {}
-    rules = []
-    for f in findings:
-        k = f.get("kind", "Unknown")
-        if k not in rule_ids:
-            rule_ids[k] = len(rules)
-            rules.append(
-                {
-                    "id": k,
-                    "name": k,
-                    "shortDescription": {"text": f"SS360 rule: {k}"},
-                    "fullDescription": {"text": f"Findings of kind {k}"},
-                    "helpUri": "https://github.com/mohan-ai-labs/secret-scan-360",
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+INFO_URI = "https://github.com/mohan-ai-labs/secret-scan-360"
+
+
+def _dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON encoding, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _rule(kind: str) -> Dict[str, Any]:
+    return {
+        "id": kind,
+        "name": kind,
+        "shortDescription": {"text": f"SS360 rule: {kind}"},
+        "fullDescription": {"text": f"Findings of kind {kind}"},
+        "helpUri": INFO_URI,
+    }
+
+
+def _result(f: Dict[str, Any], kind: str, ridx: int, uri: str) -> Dict[str, Any]:
+    line = int(f.get("line") or 1)
+    reason = f.get("reason") or kind
+    level = "error" if bool(f.get("is_secret", True)) else "warning"
+
+    # Build result object with classification data
+    result = {
+        "ruleId": kind,
+        "ruleIndex": ridx,
+        "level": level,
+        "message": {"text": reason},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": uri},
+                    "region": {"startLine": max(1, line)},
                 }
-            )
+            }
+        ],
+    }
 
-    results = []
-    for f in findings:
-        k = f.get("kind", "Unknown")
-        ridx = rule_ids.get(k, 0)
-        path = str(f.get("path", ""))
-        line = int(f.get("line") or 1)
-        reason = f.get("reason") or k
+    # Add classification properties if available
+    if "category" in f or "confidence" in f or "reasons" in f:
+        properties = {}
+        if "category" in f:
+            properties["category"] = f["category"]
+        if "confidence" in f:
+            properties["confidence"] = f["confidence"]
+        if "reasons" in f:
+            properties["reasons"] = f["reasons"]
+
+        result["properties"] = properties
+
+    return result
+
+
+def _relative_uri(path: str, root_resolved: Path, rel_paths: Dict[str, str]) -> str:
+    # Findings cluster in a few files; resolve each path only once
+    p_rel = rel_paths.get(path)
+    if p_rel is None:
         try:
-            p_rel = str(Path(path).resolve().relative_to(Path(root).resolve()))
+            p_rel = str(Path(path).resolve().relative_to(root_resolved))
         except Exception:
             p_rel = path
-        level = "error" if bool(f.get("is_secret", True)) else "warning"
-
-        # Build result object with classification data
-        result = {
-            "ruleId": k,
-            "ruleIndex": ridx,
-            "level": level,
-            "message": {"text": reason},
-            "locations": [
-                {
-                    "physicalLocation": {
-                        "artifactLocation": {"uri": p_rel},
-                        "region": {"startLine": max(1, line)},
-                    }
-                }
-            ],
-        }
+        rel_paths[path] = p_rel
+    return p_rel
 
-        # Add classification properties if available
-        if "category" in f or "confidence" in f or "reasons" in f:
-            properties = {}
-            if "category" in f:
-                properties["category"] = f["category"]
-            if "confidence" in f:
-                properties["confidence"] = f["confidence"]
-            if "reasons" in f:
-                properties["reasons"] = f["reasons"]
-
-            result["properties"] = properties
-
-        results.append(result)
 
+def _automation_id() -> str:
     # Make this upload unique per job by setting automationDetails.id
-    auto_id = "ss360-secrets-{run}-{job}-{attempt}".format(
+    return "ss360-secrets-{run}-{job}-{attempt}".format(
         run=os.getenv("GITHUB_RUN_ID", "local"),
         job=os.getenv("GITHUB_JOB", "job"),
         attempt=os.getenv("GITHUB_RUN_ATTEMPT", "1"),
     )
 
+
+def _driver(rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "driver": {
+            "name": "SS360",
+            "informationUri": INFO_URI,
+            "rules": rules,
+        }
+    }
+
+
+def build_sarif(report: Dict[str, Any]) -> Dict[str, Any]:
+    findings = report.get("findings", []) or []
+    root = str(report.get("root", ""))
+
+    root_resolved = Path(root).resolve()
+    rel_paths: Dict[str, str] = {}
+
+    # Collect rules by 'kind' and build results in one pass over findings
+    rule_ids = {}
+    rules = []
+    results = []
+    for f in findings:
+        k = f.get("kind", "Unknown")
+        ridx = rule_ids.get(k)
+        if ridx is None:
+            ridx = rule_ids[k] = len(rules)
+            rules.append(_rule(k))
+
+        uri = _relative_uri(str(f.get("path", "")), root_resolved, rel_paths)
+        results.append(_result(f, k, ridx, uri))
+
     return {
         "version": "2.1.0",
-        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "$schema": SARIF_SCHEMA,
         "runs": [
             {
-                "automationDetails": {"id": auto_id},
-                "tool": {
-                    "driver": {
-                        "name": "SS360",
-                        "informationUri": "https://github.com/mohan-ai-labs/secret-scan-360",
-                        "rules": rules,
-                    }
-                },
+                "automationDetails": {"id": _automation_id()},
+                "tool": _driver(rules),
                 "results": results,
             }
         ],
     }
+
+
+def stream_sarif(report: Dict[str, Any], fp: BinaryIO) -> None:
+    """
+    Write SARIF for *report* to a binary file object one result at a time.
+
+    Produces the same document as ``build_sarif`` (compactly encoded) without
+    materializing the results list, so memory stays proportional to the
+    number of distinct finding kinds rather than the number of findings.
+    """
+    findings = report.get("findings", []) or []
+    root_resolved = Path(str(report.get("root", ""))).resolve()
+    rel_paths: Dict[str, str] = {}
+
+    # Rules precede results in the document, so index the kinds first
+    rule_ids = {}
+    rules = []
+    for f in findings:
+        k = f.get("kind", "Unknown")
+        if k not in rule_ids:
+            rule_ids[k] = len(rules)
+            rules.append(_rule(k))
+
+    fp.write(b'{"version":"2.1.0","$schema":')
+    fp.write(_dumps(SARIF_SCHEMA))
+    fp.write(b',"runs":[{"automationDetails":')
+    fp.write(_dumps({"id": _automation_id()}))
+    fp.write(b',"tool":')
+    fp.write(_dumps(_driver(rules)))
+    fp.write(b',"results":[')
+
+    sep = b""
+    for f in findings:
+        k = f.get("kind", "Unknown")
+        uri = _relative_uri(str(f.get("path", "")), root_resolved, rel_paths)
+        fp.write(sep)
+        fp.write(_dumps(_result(f, k, rule_ids[k], uri)))
+        sep = b","
+
+    fp.write(b"]}]}")
+
+
+def dump_sarif(report: Dict[str, Any], sarif_path: str | Path) -> Path:
+    """
+    Write SARIF for *report* to *sarif_path* as compact UTF-8 JSON.
+
+    Results are streamed to the file one at a time (see ``stream_sarif``),
+    so large reports never hold the whole SARIF document in memory.
+    """
+    out = Path(sarif_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "wb") as fp:
+        stream_sarif(report, fp)
+    return out
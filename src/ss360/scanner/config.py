@@ -5,17 +5,24 @@ Scanner configuration loader for SS360.
 from __future__ import annotations
 
 import os
+import re
+import fnmatch
 import logging
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 
+from ss360.core.config_cache import load_cached
 from ss360.core.exceptions import SS360ConfigError
 
 try:
     import yaml
+    # Prefer the libyaml-backed loader; same safety as SafeLoader
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     YAML_AVAILABLE = True
 except ImportError:
     yaml = None
+    YAML_LOADER = None
     YAML_AVAILABLE = False
 
 
@@ -77,8 +84,7 @@ def _load_yaml_config(config_path: Path) -> Dict[str, Any]:
     if not YAML_AVAILABLE:
         raise ImportError("yaml module required for loading config files")
     
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = load_cached(config_path, partial(yaml.load, Loader=YAML_LOADER))
     
     if config is None:
         config = {}
@@ -91,34 +97,10 @@ def _load_yaml_config(config_path: Path) -> Dict[str, Any]:
 
 def _apply_scanner_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     """Apply default values to scanner configuration."""
-    # Set include_globs defaults
-    if "include_globs" not in config:
-        config["include_globs"] = ["**/*"]
-    
-    # Set exclude_globs defaults
-    if "exclude_globs" not in config:
-        config["exclude_globs"] = [
-            "**/.git/**",
-            "**/.svn/**", 
-            "**/.hg/**",
-            "**/.venv/**",
-            "**/venv/**",
-            "**/node_modules/**",
-            "**/dist/**",
-            "**/build/**",
-            "**/.pytest_cache/**",
-            "**/__pycache__/**",
-        ]
-    
-    # Set other defaults
-    if "min_match_length" not in config:
-        config["min_match_length"] = 8
-    
-    if "confidence_threshold" not in config:
-        config["confidence_threshold"] = 0.0
-    
-    if "disabled_detectors" not in config:
-        config["disabled_detectors"] = []
+    # A fresh defaults dict, so its values can be used without copying
+    for key, value in get_default_scanner_config().items():
+        if key not in config:
+            config[key] = value
     
     return config
 
@@ -135,7 +117,7 @@ def get_default_scanner_config() -> Dict[str, Any]:
         "exclude_globs": [
             "**/.git/**",
             "**/.svn/**",
-            "**/.hg/**", 
+            "**/.hg/**",
             "**/.venv/**",
             "**/venv/**",
             "**/node_modules/**",
@@ -150,6 +132,33 @@ def get_default_scanner_config() -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=64)
+def compile_globs(patterns: Tuple[str, ...]) -> Callable[[str], Any]:
+    """
+    Compile glob patterns into a single matcher for POSIX relative paths.
+
+    Patterns use fnmatch semantics, matched against the whole relative path
+    ("*" also matches "/"). As in gitignore, a leading "**/" also matches at
+    the top level. All patterns are combined into one regex, so each path
+    costs one match instead of one per pattern.
+
+    Args:
+        patterns: Glob patterns such as config["exclude_globs"]
+
+    Returns:
+        Callable returning a truthy value when a path matches any pattern
+    """
+    regexes = []
+    for pattern in patterns:
+        regexes.append(fnmatch.translate(pattern))
+        # As in gitignore, a leading "**/" also matches at the top level
+        if pattern.startswith("**/"):
+            regexes.append(fnmatch.translate(pattern[3:]))
+    if not regexes:
+        return lambda path: False
+    return re.compile("|".join(regexes)).match
+
+
 def create_default_config_template() -> str:
     """
     Create a minimal .ss360.yml template with commented examples.
@@ -2,10 +2,49 @@
 
 from __future__ import annotations
 import json
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from ss360.detectors import get_detector_registry
-from ss360.core.findings import Finding
+from ss360.core.findings import Finding, intern_finding_keys
+from ss360.scanner.config import compile_globs
+from ss360.classify import classify
+from ss360.policy.config import load_policy_config, get_default_policy_config
+from ss360.risk.score import calculate_risk_score
+from ss360.validate.core import run_validators_batch
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Files per worker task; large enough to amortize pickling and IPC per task
+_SCAN_CHUNK_SIZE = 64
+
+# Directory and file names never descended into or scanned in raw mode
+_DEFAULT_EXCLUDES = frozenset({
+    '.git', '.svn', '.hg', '__pycache__', '.pytest_cache',
+    'node_modules', 'dist', 'build', '.venv', 'venv'
+})
+
+# Suffixes treated as binary without opening the file
+_BINARY_SUFFIXES = frozenset({'.exe', '.dll', '.so', '.dylib', '.bin', '.zip', '.tar', '.gz'})
+
+# Leading bytes checked for NUL to spot binary files (same heuristic as git)
+_BINARY_PEEK_SIZE = 4096
+
+# Findings by content digest, so duplicated (e.g. vendored) files are scanned
+# once per process; scan_direct clears it when a scan finishes
+_FINDINGS_BY_DIGEST: Dict[bytes, List[Finding]] = {}
 
 
 def scan_direct(
@@ -13,56 +52,137 @@ def scan_direct(
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
     max_file_size: int = 1_000_000,
+    num_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Direct scanning using the new detector interface.
     
     Args:
         root_path: Path to scan (file or directory)
-        include_patterns: Glob patterns to include (not used in raw mode)
-        exclude_patterns: Glob patterns to exclude (not used in raw mode)
+        include_patterns: Glob patterns to include, relative to root_path
+        exclude_patterns: Glob patterns to exclude, relative to root_path
         max_file_size: Maximum file size to scan
+        num_workers: Worker processes for directory scans (default: CPU count;
+            1 scans in-process)
         
     Returns:
         List of finding dictionaries
     """
     root = Path(root_path).resolve()
-    registry = get_detector_registry()
-    all_findings = []
     
-    if root.is_file():
-        # Scan single file
-        findings = _scan_file(root, registry, max_file_size)
-        all_findings.extend(findings)
-    elif root.is_dir():
-        # Scan directory recursively
-        for file_path in _iter_scannable_files(root, include_patterns, exclude_patterns):
-            findings = _scan_file(file_path, registry, max_file_size)
-            all_findings.extend(findings)
-    else:
-        raise FileNotFoundError(f"Path not found: {root}")
+    try:
+        if root.is_file():
+            # Scan single file
+            return _scan_chunk([root], max_file_size)
+        elif root.is_dir():
+            # Scan directory recursively
+            files = _iter_scannable_files(root, include_patterns, exclude_patterns)
+            return _scan_files(files, max_file_size, num_workers)
+        else:
+            raise FileNotFoundError(f"Path not found: {root}")
+    finally:
+        _FINDINGS_BY_DIGEST.clear()
+
+
+def _scan_files(
+    files: Iterable[Path], max_file_size: int, num_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Scan files, fanning out to worker processes when there is enough work.
+    
+    *files* may be a lazy iterator: chunks are handed to workers as they are
+    produced, so scanning overlaps the directory walk.
+    """
+    workers = num_workers or os.cpu_count() or 1
+    chunks = _chunked(files, _SCAN_CHUNK_SIZE)
+    head = list(islice(chunks, 2))
+    
+    # Process start-up costs more than a single chunk of work
+    if workers <= 1 or len(head) <= 1:
+        return _scan_chunks(chain(head, chunks), max_file_size)
+    
+    # Remember what the pool was given so a fallback can rescan it
+    submitted = list(head)
+    
+    def _submitting():
+        yield from head
+        for chunk in chunks:
+            submitted.append(chunk)
+            yield chunk
     
-    # Convert Finding objects to dictionaries
-    return [f.to_dict() for f in all_findings]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            all_findings = []
+            # map() yields in submission order, so output order is unchanged
+            for findings in pool.map(_scan_chunk, _submitting(), repeat(max_file_size)):
+                all_findings.extend(findings)
+            return all_findings
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        # Platforms without working multiprocessing fall back to one process
+        return _scan_chunks(chain(submitted, chunks), max_file_size)
+
+
+def _chunked(files: Iterable[Path], size: int) -> Iterator[List[Path]]:
+    """Group files into lists of up to *size*, consuming *files* lazily."""
+    it = iter(files)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _scan_chunks(chunks: Iterable[List[Path]], max_file_size: int) -> List[Dict[str, Any]]:
+    """Scan chunks of files in this process."""
+    findings = []
+    for chunk in chunks:
+        findings.extend(_scan_chunk(chunk, max_file_size))
+    return findings
 
 
-def _scan_file(file_path: Path, registry, max_file_size: int) -> List[Finding]:
-    """Scan a single file and return findings."""
+def _scan_chunk(paths: List[Path], max_file_size: int) -> List[Dict[str, Any]]:
+    """Scan a batch of files; runs in worker processes, so returns plain dicts."""
+    # The registry is a per-process global, built once per worker
+    registry = get_detector_registry()
+    cwd_prefix = os.path.join(os.getcwd(), "")
+    findings = []
+    for file_path in paths:
+        findings.extend(f.to_dict() for f in _scan_file(file_path, registry, max_file_size, cwd_prefix))
+    return findings
+
+
+def _scan_file(file_path: Path, registry, max_file_size: int, cwd_prefix: str) -> List[Finding]:
+    """Scan a single file and return findings; *cwd_prefix* ends with a separator."""
     try:
         if file_path.stat().st_size > max_file_size:
             return []
         
-        # Read file content
-        blob = file_path.read_bytes()
+        # Read file content, giving up early on binary files
+        with open(file_path, "rb") as f:
+            blob = f.read(_BINARY_PEEK_SIZE)
+            if b"\x00" in blob:
+                return []
+            blob += f.read()
         
         # Get relative path for reporting
-        try:
-            rel_path = str(file_path.relative_to(Path.cwd()))
-        except ValueError:
-            rel_path = str(file_path)
+        rel_path = str(file_path)
+        if rel_path.startswith(cwd_prefix):
+            rel_path = rel_path[len(cwd_prefix):]
+        
+        # Detectors only use the path to label findings, so identical
+        # content yields the same findings under a different path
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        cached = _FINDINGS_BY_DIGEST.get(digest)
+        if cached is not None:
+            return [
+                replace(f, path=rel_path, meta=dict(f.meta) if f.meta else f.meta)
+                for f in cached
+            ]
         
         # Scan with all detectors
-        return registry.scan_with_all(blob, rel_path)
+        findings = registry.scan_with_all(blob, rel_path)
+        _FINDINGS_BY_DIGEST[digest] = findings
+        return findings
         
     except (OSError, PermissionError, UnicodeDecodeError):
         # Skip files that can't be read
@@ -73,31 +193,48 @@ def _iter_scannable_files(
     root_dir: Path, 
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None
-) -> List[Path]:
-    """Iterate over scannable files in a directory."""
-    # Default exclude patterns for raw scanning
-    default_excludes = {
-        '.git', '.svn', '.hg', '__pycache__', '.pytest_cache',
-        'node_modules', 'dist', 'build', '.venv', 'venv'
-    }
+) -> Iterator[Path]:
+    """Iterate over scannable files in a directory, yielding them as found."""
+    # Each glob list is compiled once into a single matcher
+    is_included = compile_globs(tuple(include_patterns)) if include_patterns else None
+    is_excluded = compile_globs(tuple(exclude_patterns)) if exclude_patterns else None
     
-    scannable_files = []
+    root_str = str(root_dir)
+    prefix_len = len(os.path.join(root_str, ""))
     
-    for file_path in root_dir.rglob('*'):
-        if not file_path.is_file():
-            continue
-            
-        # Skip files in excluded directories
-        if any(part in default_excludes for part in file_path.parts):
-            continue
-            
-        # Skip binary files (simple heuristic)
-        if file_path.suffix in {'.exe', '.dll', '.so', '.dylib', '.bin', '.zip', '.tar', '.gz'}:
+    # Walk with os.scandir so excluded directories are pruned before we
+    # descend into them, instead of listing them and discarding every file
+    stack = [root_str]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
-            
-        scannable_files.append(file_path)
-    
-    return scannable_files
+        with it:
+            for entry in it:
+                if entry.name in _DEFAULT_EXCLUDES:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                
+                # Skip binary files (simple heuristic)
+                if os.path.splitext(entry.name)[1] in _BINARY_SUFFIXES:
+                    continue
+                
+                if is_included or is_excluded:
+                    rel_path = entry.path[prefix_len:].replace(os.sep, "/")
+                    if is_included and not is_included(rel_path):
+                        continue
+                    if is_excluded and is_excluded(rel_path):
+                        continue
+                
+                yield Path(entry.path)
 
 
 def scan_with_policy_and_classification(
@@ -108,6 +245,7 @@ def scan_with_policy_and_classification(
     exclude_patterns: Optional[List[str]] = None,
     only_category: Optional[str] = None,
     raw_mode: bool = False,
+    num_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Scan with policy enforcement and classification.
@@ -117,7 +255,9 @@ def scan_with_policy_and_classification(
     # First, do the basic scanning
     if raw_mode:
         # Raw mode: scan the path directly without git-based filtering
-        findings = scan_direct(root_path, include_patterns, exclude_patterns)
+        findings = scan_direct(
+            root_path, include_patterns, exclude_patterns, num_workers=num_workers
+        )
     else:
         # Git mode: use scanner configuration with proper search order
         try:
@@ -133,16 +273,7 @@ def scan_with_policy_and_classification(
                 
                 if Scanner is not None:
                     try:
-                        # Create scanner using the default config path as fallback
-                        # Look for legacy detectors.yaml but don't require it
-                        legacy_config_path = "services/agents/app/config/detectors.yaml"
-                        if Path(legacy_config_path).exists():
-                            scanner = Scanner.from_config(legacy_config_path)
-                        else:
-                            # Create scanner with built-in registry if no legacy config
-                            from services.agents.app.detectors.registry import build_registry
-                            registry = build_registry(None)  # Uses built-in defaults
-                            scanner = Scanner(registry=registry)
+                        scanner = _get_legacy_scanner()
                         
                         if scanner is None:
                             raise SS360ConfigError(
@@ -169,26 +300,31 @@ def scan_with_policy_and_classification(
                         findings = scan_direct(
                             root_path, 
                             include_patterns or scanner_config.get("include_globs"), 
-                            exclude_patterns or scanner_config.get("exclude_globs")
+                            exclude_patterns or scanner_config.get("exclude_globs"),
+                            num_workers=num_workers,
                         )
                 else:
                     # Scanner not available, use direct scanning with config
                     findings = scan_direct(
                         root_path, 
                         include_patterns or scanner_config.get("include_globs"), 
-                        exclude_patterns or scanner_config.get("exclude_globs")
+                        exclude_patterns or scanner_config.get("exclude_globs"),
+                        num_workers=num_workers,
                     )
             except ImportError:
                 # Scanner import failed, use direct scanning with config
                 findings = scan_direct(
                     root_path, 
                     include_patterns or scanner_config.get("include_globs"), 
-                    exclude_patterns or scanner_config.get("exclude_globs")
+                    exclude_patterns or scanner_config.get("exclude_globs"),
+                    num_workers=num_workers,
                 )
         except ImportError:
             # Fallback to direct scanning if scanner config unavailable
             print("[ss360] Using default scanner config")
-            findings = scan_direct(root_path, include_patterns, exclude_patterns)
+            findings = scan_direct(
+                root_path, include_patterns, exclude_patterns, num_workers=num_workers
+            )
     
     # Enhance findings with validation and classification
     enhanced_findings, validation_results = _enhance_findings(findings)
@@ -209,6 +345,43 @@ def scan_with_policy_and_classification(
     }
 
 
+# Legacy detectors.yaml, relative to the working directory; optional
+_LEGACY_CONFIG_PATH = "services/agents/app/config/detectors.yaml"
+
+
+def _get_legacy_scanner():
+    """Return the legacy Scanner for the current detectors.yaml, reusing it while unchanged."""
+    legacy_config = Path(_LEGACY_CONFIG_PATH)
+    try:
+        st = legacy_config.stat()
+    except OSError:
+        # Create scanner with built-in registry if no legacy config
+        return _build_legacy_scanner(None, 0, 0)
+    return _build_legacy_scanner(str(legacy_config.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _build_legacy_scanner(config_path: Optional[str], mtime_ns: int, size: int):
+    """Build a legacy Scanner; the stat fields only key the cache, so edits rebuild it."""
+    from ss360.scanner import Scanner
+    
+    if config_path is None:
+        from services.agents.app.detectors.registry import build_registry
+        return Scanner(registry=build_registry(None))  # Uses built-in defaults
+    return Scanner.from_config(config_path)
+
+
+def serialize_findings(result: Dict[str, Any]) -> bytes:
+    """
+    Encode a scan result as indented UTF-8 JSON with a trailing newline.
+    
+    Uses orjson when available; the stdlib fallback produces the same bytes.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(result, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """Enhance findings with validation and classification."""
     enhanced = []
@@ -216,8 +389,6 @@ def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, An
     
     # Load policy config for validation settings
     try:
-        from ss360.policy.config import load_policy_config, get_default_policy_config
-        
         # Try to load from common locations
         policy_paths = ["policy.yml", "policy.yaml", "policy.example.yml"]
         policy_config = None
@@ -236,40 +407,33 @@ def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, An
         # Fallback to safe defaults if no policy config
         validation_config = {"allow_network": False, "global_qps": 2.0}
     
+    # Validate all findings in one pass over the validator registry
+    try:
+        batch_results = run_validators_batch(findings, {"validators": validation_config})
+    except Exception:
+        # If validation fails, continue without it
+        batch_results = [[] for _ in findings]
+    
     for i, finding in enumerate(findings):
-        # Run validation for this finding
-        try:
-            from ss360.validate.core import run_validators
-            validation_results_list = run_validators(
-                finding, {"validators": validation_config}
-            )
-            validation_results[str(i)] = [
-                {
-                    "state": result.state.value,
-                    "evidence": result.evidence,
-                    "reason": result.reason,
-                    "validator_name": result.validator_name,
-                }
-                for result in validation_results_list
-            ]
-        except Exception:
-            # If validation fails, continue without it
-            validation_results[str(i)] = []
-            validation_results_list = []
+        validation_results[str(i)] = [
+            {
+                "state": result.state.value,
+                "evidence": result.evidence,
+                "reason": result.reason,
+                "validator_name": result.validator_name,
+            }
+            for result in batch_results[i]
+        ]
         
         # Run classification on each finding with validation context
         try:
-            from ss360.classify import classify
-            
-            # Create a copy of finding for classification with original tokens
-            classification_finding = finding.copy()
-            
-            # Use original token/URL from meta if available for better classification
-            meta = finding.get("meta", {})
-            if "full_token" in meta:
-                classification_finding["match"] = meta["full_token"]
-            elif "full_url" in meta:
-                classification_finding["match"] = meta["full_url"]
+            # Use original token/URL if available for better classification
+            raw_secret = finding.get("_raw_secret")
+            if raw_secret is not None:
+                classification_finding = dict(finding, match=raw_secret)
+            else:
+                # Nothing to substitute; classify and score only read the finding
+                classification_finding = finding
             
             # Pass validation results to classifier
             context = {"validation_results": validation_results[str(i)]}
@@ -277,12 +441,11 @@ def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, An
             
             # Calculate risk score
             try:
-                from ss360.risk.score import calculate_risk_score
                 risk_score = calculate_risk_score(classification_finding, validation_results[str(i)])
             except Exception:
                 risk_score = 50  # Default risk score
             
-            enhanced_finding = finding.copy()
+            enhanced_finding = _without_raw_secret(finding)
             enhanced_finding.update({
                 "category": category,
                 "confidence": confidence,
@@ -291,19 +454,11 @@ def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, An
                 "validated": _create_validated_field(validation_results[str(i)])
             })
             
-            # Remove full secrets from meta to ensure they don't appear in output
-            if "meta" in enhanced_finding:
-                meta = enhanced_finding["meta"].copy()
-                # Remove full token/URL fields that contain unredacted secrets
-                meta.pop("full_token", None)
-                meta.pop("full_url", None)
-                enhanced_finding["meta"] = meta
-            
-            enhanced.append(enhanced_finding)
+            enhanced.append(intern_finding_keys(enhanced_finding))
             
         except Exception as e:
             # If classification fails, add finding without classification
-            enhanced_finding = finding.copy()
+            enhanced_finding = _without_raw_secret(finding)
             enhanced_finding.update({
                 "category": "unknown",
                 "confidence": 0.1,
@@ -312,19 +467,18 @@ def _enhance_findings(findings: List[Dict[str, Any]]) -> tuple[List[Dict[str, An
                 "validated": _create_validated_field(validation_results.get(str(i), []))
             })
             
-            # Remove full secrets from meta to ensure they don't appear in output
-            if "meta" in enhanced_finding:
-                meta = enhanced_finding["meta"].copy()
-                # Remove full token/URL fields that contain unredacted secrets
-                meta.pop("full_token", None)
-                meta.pop("full_url", None)
-                enhanced_finding["meta"] = meta
-            
-            enhanced.append(enhanced_finding)
+            enhanced.append(intern_finding_keys(enhanced_finding))
     
     return enhanced, validation_results
 
 
+def _without_raw_secret(finding: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a finding without the unredacted secret that Finding.to_dict() carries."""
+    enhanced_finding = finding.copy()
+    enhanced_finding.pop("_raw_secret", None)
+    return enhanced_finding
+
+
 def _create_validated_field(validation_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Create validated field from validation results."""
     if not validation_results:
@@ -10,15 +10,27 @@ from __future__ import annotations
 import json
 import re
 from typing import Dict, Any
-from .core import ValidationResult, ValidationState
+from urllib.parse import parse_qs, urlparse
+from .core import SLACK_WEBHOOK_REGEX, ValidationResult, ValidationState, _redact_secret
+
+# Component formats checked by SlackWebhookLocalValidator
+_TEAM_ID_RE = re.compile(r"^T[A-Z0-9]{8}$")
+_CHANNEL_ID_RE = re.compile(r"^[BC][A-Z0-9]{8}$")
+_TOKEN_RE = re.compile(r"^[A-Za-z0-9]{24}$")
+
+# Service account emails accepted by GCPServiceAccountKeyLiveValidator
+_SA_EMAIL_RE = re.compile(r"^[^@]+@[^@]+\.iam\.gserviceaccount\.com$")
 
 
 class SlackWebhookLocalValidator:
     """Local-only validator for Slack webhooks with enhanced format/signer checks."""
 
     # Slack webhook URL pattern with capture groups for validation
-    SLACK_WEBHOOK_PATTERN = re.compile(
-        r"https://hooks\.slack\.com/services/([A-Z0-9]{9})/([A-Z0-9]{9})/([A-Za-z0-9]{24})"
+    SLACK_WEBHOOK_PATTERN = SLACK_WEBHOOK_REGEX
+
+    # The same URL with the team, channel/bot and token formats folded in
+    SLACK_WEBHOOK_STRICT_PATTERN = re.compile(
+        r"https://hooks\.slack\.com/services/T[A-Z0-9]{8}/[BC][A-Z0-9]{8}/[A-Za-z0-9]{24}"
     )
 
     @property
@@ -37,6 +49,22 @@ class SlackWebhookLocalValidator:
         """Validate Slack webhook format and perform enhanced signer checks."""
         match = finding.get("match", "")
 
+        # One pass accepts well-formed webhooks; only failures are re-examined
+        # component by component to say what is wrong
+        if not self.SLACK_WEBHOOK_STRICT_PATTERN.match(match):
+            return self._format_failure(match)
+
+        # All validations passed
+        redacted_url = self._redact_secret(match)
+        return ValidationResult(
+            state=ValidationState.VALID,
+            evidence=f"Valid Slack webhook format with enhanced checks: {redacted_url}",
+            reason="Passed Slack webhook URL pattern and component validation",
+            validator_name=self.name,
+        )
+
+    def _format_failure(self, match: str) -> ValidationResult:
+        """Explain why *match* failed the strict webhook pattern."""
         webhook_match = self.SLACK_WEBHOOK_PATTERN.match(match)
         if not webhook_match:
             return ValidationResult(
@@ -52,43 +80,38 @@ class SlackWebhookLocalValidator:
         validation_issues = []
 
         # Team ID should be a valid Slack team ID format
-        if not re.match(r"^T[A-Z0-9]{8}$", team_id):
+        if not _TEAM_ID_RE.match(team_id):
             validation_issues.append(f"Invalid team ID format: {team_id}")
 
         # Channel/Bot ID should be valid format
-        if not re.match(r"^[BC][A-Z0-9]{8}$", channel_id):
+        if not _CHANNEL_ID_RE.match(channel_id):
             validation_issues.append(f"Invalid channel/bot ID format: {channel_id}")
 
         # Token should be exactly 24 characters of valid base64-like characters
-        if len(token) != 24 or not re.match(r"^[A-Za-z0-9]{24}$", token):
+        if len(token) != 24 or not _TOKEN_RE.match(token):
             validation_issues.append(f"Invalid token format: length={len(token)}")
 
-        if validation_issues:
-            return ValidationResult(
-                state=ValidationState.INVALID,
-                reason=f"Format validation failed: {'; '.join(validation_issues)}",
-                validator_name=self.name,
-            )
-
-        # All validations passed
-        redacted_url = self._redact_secret(match)
         return ValidationResult(
-            state=ValidationState.VALID,
-            evidence=f"Valid Slack webhook format with enhanced checks: {redacted_url}",
-            reason="Passed Slack webhook URL pattern and component validation",
+            state=ValidationState.INVALID,
+            reason=f"Format validation failed: {'; '.join(validation_issues)}",
             validator_name=self.name,
         )
 
-    def _redact_secret(self, secret: str) -> str:
-        """Redact secret showing only last 4 characters."""
-        if len(secret) <= 4:
-            return "****"
-        return "****" + secret[-4:]
+    _redact_secret = staticmethod(_redact_secret)
 
 
 class GCPServiceAccountKeyLiveValidator:
     """Validator that checks GCP service account key validity via generateAccessToken."""
 
+    # Fields every service account key file has, in the order they are reported
+    REQUIRED_FIELDS = (
+        "type",
+        "project_id",
+        "private_key_id",
+        "private_key",
+        "client_email",
+    )
+
     @property
     def name(self) -> str:
         return "gcp_sa_key_live"
@@ -115,16 +138,8 @@ class GCPServiceAccountKeyLiveValidator:
             if key_data.startswith("{"):
                 # JSON format service account key
                 key_json = json.loads(key_data)
-                required_fields = [
-                    "type",
-                    "project_id",
-                    "private_key_id",
-                    "private_key",
-                    "client_email",
-                ]
-
                 missing_fields = [
-                    field for field in required_fields if field not in key_json
+                    field for field in self.REQUIRED_FIELDS if field not in key_json
                 ]
                 if missing_fields:
                     return ValidationResult(
@@ -178,8 +193,7 @@ class GCPServiceAccountKeyLiveValidator:
             client_email = key_json.get("client_email", "")
 
             # Validate email format
-            email_pattern = r"^[^@]+@[^@]+\.iam\.gserviceaccount\.com$"
-            if not re.match(email_pattern, client_email):
+            if not _SA_EMAIL_RE.match(client_email):
                 return ValidationResult(
                     state=ValidationState.INVALID,
                     reason="Invalid service account email format",
@@ -209,6 +223,14 @@ class GCPServiceAccountKeyLiveValidator:
 class AzureSASLiveValidator:
     """Validator that checks Azure SAS token validity via HEAD request."""
 
+    # Storage service hosts a SAS URL may point at
+    AZURE_DOMAINS = (
+        ".blob.core.windows.net",
+        ".queue.core.windows.net",
+        ".table.core.windows.net",
+        ".file.core.windows.net",
+    )
+
     @property
     def name(self) -> str:
         return "azure_sas_live"
@@ -251,21 +273,16 @@ class AzureSASLiveValidator:
             return False
 
         try:
-            from urllib.parse import urlparse, parse_qs
-
             parsed = urlparse(token)
 
             # Must be HTTPS and point to Azure storage domains
             if parsed.scheme != "https":
                 return False
 
-            azure_domains = [
-                ".blob.core.windows.net",
-                ".queue.core.windows.net",
-                ".table.core.windows.net",
-                ".file.core.windows.net",
-            ]
-            if not any(domain in parsed.netloc for domain in azure_domains):
+            # Match the host suffix, so look-alikes such as
+            # "x.blob.core.windows.net.evil.com" are rejected
+            host = parsed.netloc.rpartition("@")[2].partition(":")[0].lower()
+            if not host.endswith(self.AZURE_DOMAINS):
                 return False
 
             # Check for required SAS parameters
@@ -286,8 +303,6 @@ class AzureSASLiveValidator:
             # to verify it's valid. For this implementation, we'll simulate the process
 
             # Extract some basic info for evidence
-            from urllib.parse import urlparse
-
             parsed = urlparse(sas_url)
             host = parsed.netloc
 
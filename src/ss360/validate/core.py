@@ -11,7 +11,7 @@ import re
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Protocol, Any
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
 
 class ValidationState(Enum):
@@ -22,7 +22,7 @@ class ValidationState(Enum):
     INDETERMINATE = "indeterminate"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validating a finding."""
 
@@ -58,15 +58,19 @@ class Validator(Protocol):
 class TokenBucket:
     """Token bucket for rate limiting."""
 
+    __slots__ = ("qps", "capacity", "tokens", "last_refill", "_now")
+
     def __init__(self, qps: float, capacity: Optional[float] = None):
         self.qps = qps
         self.capacity = capacity or qps  # Burst capacity
         self.tokens = self.capacity
-        self.last_refill = time.time()
+        # Monotonic, so wall-clock adjustments cannot skew the refill rate
+        self._now = time.monotonic
+        self.last_refill = self._now()
 
     def acquire(self, tokens: int = 1) -> bool:
         """Try to acquire tokens. Returns True if successful."""
-        now = time.time()
+        now = self._now()
 
         # Add tokens based on elapsed time
         elapsed = now - self.last_refill
@@ -79,6 +83,26 @@ class TokenBucket:
             return True
         return False
 
+    def acquire_blocking(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire tokens, sleeping once until enough have refilled.
+
+        Returns False without sleeping if the wait would exceed *timeout*
+        seconds, or if the request is larger than the bucket can ever hold.
+        """
+        if self.acquire(tokens):
+            return True
+        if tokens > self.capacity or self.qps <= 0:
+            return False
+
+        # acquire() has just refilled, so this is the exact shortfall
+        wait = (tokens - self.tokens) / self.qps
+        if timeout is not None and wait > timeout:
+            return False
+
+        time.sleep(wait)
+        return self.acquire(tokens)
+
 
 class ValidatorRegistry:
     """Registry for managing validators."""
@@ -86,6 +110,9 @@ class ValidatorRegistry:
     def __init__(self):
         self._validators: Dict[str, Validator] = {}
         self._buckets: Dict[str, TokenBucket] = {}
+        # Snapshots returned by get_all()/get_plan(); reset on registration
+        self._all: Optional[Tuple[Validator, ...]] = None
+        self._plans: Dict[bool, Tuple[Tuple[Validator, Optional[ValidationResult]], ...]] = {}
 
     def register(self, validator: Validator) -> None:
         """Register a validator."""
@@ -94,22 +121,68 @@ class ValidatorRegistry:
 
         self._validators[validator.name] = validator
         self._buckets[validator.name] = TokenBucket(validator.rate_limit_qps)
-
-    def get_all(self) -> List[Validator]:
-        """Get all registered validators."""
-        return list(self._validators.values())
+        self._all = None
+        self._plans = {}
+
+    def get_all(self) -> Tuple[Validator, ...]:
+        """Get all registered validators, in registration order."""
+        if self._all is None:
+            self._all = tuple(self._validators.values())
+        return self._all
+
+    def get_plan(
+        self, allow_network: bool
+    ) -> Tuple[Tuple[Validator, Optional[ValidationResult]], ...]:
+        """
+        Get (validator, skipped_result) pairs, in registration order.
+
+        skipped_result is the result reported instead of running a network
+        validator while the network is disabled, and None for validators
+        that should run. Results are immutable, so they are shared.
+        """
+        allow_network = bool(allow_network)
+        plan = self._plans.get(allow_network)
+        if plan is None:
+            plan = self._plans[allow_network] = tuple(
+                (validator, _skipped_result(validator, allow_network))
+                for validator in self.get_all()
+            )
+        return plan
 
     def get_bucket(self, validator_name: str) -> TokenBucket:
         """Get rate limiting bucket for a validator."""
         return self._buckets[validator_name]
 
 
+def _skipped_result(validator: Validator, allow_network: bool) -> Optional[ValidationResult]:
+    """Result for a validator that must not run, or None if it may."""
+    if validator.requires_network and not allow_network:
+        return ValidationResult(
+            state=ValidationState.INDETERMINATE,
+            reason="Network disabled - validator skipped",
+            validator_name=validator.name,
+        )
+    return None
+
+
+def _redact_secret(secret: str) -> str:
+    """Redact secret showing only last 4 characters."""
+    if len(secret) <= 4:
+        return "****"
+    return "****" + secret[-4:]
+
+
+# Slack webhook URL, capturing the team, channel/bot and token components;
+# shared by the Slack validators here and in additional_validators
+SLACK_WEBHOOK_REGEX = re.compile(
+    r"https://hooks\.slack\.com/services/([A-Z0-9]{9})/([A-Z0-9]{9})/([A-Za-z0-9]{24})"
+)
+
+
 class SlackWebhookValidator:
     """Simple local validator for Slack webhooks (format-only, no network)."""
 
-    SLACK_WEBHOOK_PATTERN = re.compile(
-        r"https://hooks\.slack\.com/services/[A-Z0-9]{9}/[A-Z0-9]{9}/[A-Za-z0-9]{24}"
-    )
+    SLACK_WEBHOOK_PATTERN = SLACK_WEBHOOK_REGEX
 
     @property
     def name(self) -> str:
@@ -143,30 +216,29 @@ class SlackWebhookValidator:
                 validator_name=self.name,
             )
 
-    def _redact_secret(self, secret: str) -> str:
-        """Redact secret showing only last 4 characters."""
-        if len(secret) <= 4:
-            return "****"
-        return "****" + secret[-4:]
+    _redact_secret = staticmethod(_redact_secret)
+
+
+# Potential secrets in evidence: longer alphanumeric strings with underscores
+_SECRET_RE = re.compile(r"\b[A-Za-z0-9+/_-]{16,}\b")  # Match secrets 16+ chars
+
+
+def _redact_match(match: re.Match) -> str:
+    """Redact a _SECRET_RE match, keeping only its last 4 characters."""
+    # _SECRET_RE only matches 16+ chars, so the short-secret case never applies
+    return "****" + match.group(0)[-4:]
 
 
 def _redact_evidence(evidence: str) -> str:
     """Redact secrets in evidence strings."""
-    # Simple implementation - find potential secrets and redact them
-    lines = evidence.split("\n")
-    redacted_lines = []
-
-    for line in lines:
-        # Look for patterns that might be secrets (longer alphanumeric strings
-        # with underscores)
-        redacted_line = re.sub(
-            r"\b[A-Za-z0-9+/_-]{16,}\b",  # Match secrets 16+ chars
-            lambda m: ("****" + m.group(0)[-4:] if len(m.group(0)) > 4 else "****"),
-            line,
-        )
-        redacted_lines.append(redacted_line)
+    # Nothing shorter than the minimum secret length can match
+    if len(evidence) < 16:
+        return evidence
 
-    return "\n".join(redacted_lines)
+    # The character class excludes newlines and "\n" is a word boundary like
+    # the start/end of a line, so one pass over the whole string redacts
+    # exactly what a line-by-line pass would.
+    return _SECRET_RE.sub(_redact_match, evidence)
 
 
 def run_validators(
@@ -188,32 +260,93 @@ def run_validators(
     if registry is None:
         registry = _get_default_registry()
 
-    results = []
+    # Get validator configuration
+    validator_config = config.get("validators", {})
+    allow_network = validator_config.get("allow_network", False)
+    global_qps = validator_config.get("global_qps", 2.0)
+
+    return _run_validators_on(
+        finding, registry.get_plan(allow_network), registry.get_bucket, global_qps
+    )
+
+
+def run_validators_batch(
+    findings: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    registry: Optional[ValidatorRegistry] = None,
+) -> List[List[ValidationResult]]:
+    """
+    Run validators on many findings; same results as run_validators on each.
+
+    The configuration is read and the validators are resolved once for the
+    whole batch. Without an explicit registry each finding still starts with
+    full per-validator buckets, as the fresh default registry built by each
+    run_validators call would give it.
+
+    Args:
+        findings: The findings to validate
+        config: Configuration dictionary with validators settings
+        registry: Optional validator registry (uses default if None)
+
+    Returns:
+        List of validation results for each finding, in order
+    """
+    shared_buckets = registry is not None
+    if registry is None:
+        registry = _get_default_registry()
 
     # Get validator configuration
     validator_config = config.get("validators", {})
     allow_network = validator_config.get("allow_network", False)
     global_qps = validator_config.get("global_qps", 2.0)
 
+    plan = registry.get_plan(allow_network)
+    get_bucket = registry.get_bucket
+    # Skipped validators never touch their buckets
+    active = [validator for validator, skipped in plan if skipped is None]
+
+    batch_results = []
+    for finding in findings:
+        if not shared_buckets:
+            get_bucket = {
+                validator.name: TokenBucket(validator.rate_limit_qps)
+                for validator in active
+            }.__getitem__
+        batch_results.append(_run_validators_on(finding, plan, get_bucket, global_qps))
+    return batch_results
+
+
+def _run_validators_on(
+    finding: Dict[str, Any],
+    plan: Tuple[Tuple[Validator, Optional[ValidationResult]], ...],
+    get_bucket: Callable[[str], TokenBucket],
+    global_qps: float,
+) -> List[ValidationResult]:
+    """Run a registry plan on one finding, rate limited by *get_bucket* buckets."""
+    results = []
+
     # Create global rate limiter
     global_bucket = TokenBucket(global_qps)
 
-    for validator in registry.get_all():
+    for validator, skipped in plan:
         # Skip network validators if network is disabled
-        if validator.requires_network and not allow_network:
-            results.append(
-                ValidationResult(
-                    state=ValidationState.INDETERMINATE,
-                    reason="Network disabled - validator skipped",
-                    validator_name=validator.name,
-                )
-            )
+        if skipped is not None:
+            results.append(skipped)
             continue
 
-        # Check rate limits
-        validator_bucket = registry.get_bucket(validator.name)
+        # Check rate limits; a live check is worth waiting up to one token
+        # interval for rather than giving up on
+        validator_bucket = get_bucket(validator.name)
+        if not global_bucket.acquire():
+            rate_limited = True
+        elif validator.requires_network and validator.rate_limit_qps > 0:
+            rate_limited = not validator_bucket.acquire_blocking(
+                timeout=1.0 / validator.rate_limit_qps
+            )
+        else:
+            rate_limited = not validator_bucket.acquire()
 
-        if not global_bucket.acquire() or not validator_bucket.acquire():
+        if rate_limited:
             results.append(
                 ValidationResult(
                     state=ValidationState.INDETERMINATE,
@@ -227,15 +360,17 @@ def run_validators(
         try:
             result = validator.validate(finding)
 
-            # Ensure evidence is redacted
+            # Ensure evidence is redacted; validators normally redact their
+            # own, so only rebuild the result when something was left over
             if result.evidence:
                 redacted_evidence = _redact_evidence(result.evidence)
-                result = ValidationResult(
-                    state=result.state,
-                    evidence=redacted_evidence,
-                    reason=result.reason,
-                    validator_name=result.validator_name,
-                )
+                if redacted_evidence != result.evidence:
+                    result = ValidationResult(
+                        state=result.state,
+                        evidence=redacted_evidence,
+                        reason=result.reason,
+                        validator_name=result.validator_name,
+                    )
 
             results.append(result)
 
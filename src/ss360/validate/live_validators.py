@@ -6,11 +6,107 @@ These validators make network calls to verify if credentials are valid.
 """
 from __future__ import annotations
 
+import base64
+import hashlib
+import http.client
 import json
+import threading
+import time
 import urllib.request
-import urllib.error
-from typing import Dict, Any
-from .core import ValidationResult, ValidationState
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+from .core import TokenBucket, ValidationResult, ValidationState
+
+
+class _KeepAliveConnection:
+    """
+    A lazily opened HTTPS connection to one host, reused across requests.
+
+    Validating many tokens against the same API then pays for the TCP and
+    TLS handshakes once instead of per token. The https proxy from the
+    environment is honoured via CONNECT tunnelling, as urllib would.
+    """
+
+    # Larger bodies are refused so a misbehaving server cannot bloat memory
+    max_body = 65536
+
+    def __init__(self, host: str, timeout: float = 10):
+        self.host = host
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        proxy = urllib.request.getproxies().get("https")
+        if not proxy or urllib.request.proxy_bypass(self.host):
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+        parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        conn = http.client.HTTPSConnection(parts.hostname, parts.port or 80, timeout=self.timeout)
+        tunnel_headers = {}
+        if parts.username:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+        conn.set_tunnel(self.host, 443, headers=tunnel_headers)
+        return conn
+
+    def get(self, path: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """GET *path*, returning the status code and body (at most max_body bytes)."""
+        with self._lock:
+            while True:
+                reused = self._conn is not None
+                if not reused:
+                    self._conn = self._connect()
+                try:
+                    self._conn.request("GET", path, headers=headers)
+                    response = self._conn.getresponse()
+                    body = response.read(self.max_body + 1)
+                    if len(body) > self.max_body:
+                        raise ValueError(f"response body exceeds {self.max_body} bytes")
+                    return response.status, body
+                except Exception as e:
+                    self._conn.close()
+                    self._conn = None
+                    # The server may have dropped an idle connection; retry once on a new one
+                    if not (reused and isinstance(e, ConnectionError)):
+                        raise
+
+
+class _TTLCache:
+    """A small thread-safe LRU cache whose entries expire after *ttl* seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, Tuple[float, ValidationResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[ValidationResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: bytes, value: ValidationResult, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_GITHUB_API = _KeepAliveConnection("api.github.com")
+# Definitive GitHub answers by token hash, so a token repeated across files is
+# checked once; keyed by digest so raw tokens are never retained
+_GITHUB_RESULTS = _TTLCache(maxsize=4096, ttl=300)
+# A rejected token does not come back to life, so keep those verdicts longer
+_REJECTED_TOKEN_TTL = 3600
 
 
 class GitHubPATLiveValidator:
@@ -31,50 +127,48 @@ class GitHubPATLiveValidator:
             ValidationResult with state and redacted evidence
         """
         token = finding.get("match", "")
-        if not token or not token.startswith(("ghp_", "github_pat_", "ghs_", "gho_")):
+        # No real token is this short; reject before any prefix checks or network I/O
+        if not token or len(token) < 10 or not token.startswith(("ghp_", "github_pat_", "ghs_", "gho_")):
             return ValidationResult(
                 state=ValidationState.INVALID,
                 reason="Invalid GitHub PAT format",
                 validator_name=self.name,
             )
 
+        key = hashlib.sha256(token.encode()).digest()
+        result = _GITHUB_RESULTS.get(key)
+        if result is None:
+            result = self._check_token(token)
+            # Network errors and 5xx may be transient, so only cache verdicts
+            if result.state == ValidationState.INVALID:
+                _GITHUB_RESULTS.set(key, result, ttl=_REJECTED_TOKEN_TTL)
+            elif result.state == ValidationState.VALID:
+                _GITHUB_RESULTS.set(key, result)
+        return result
+
+    def _check_token(self, token: str) -> ValidationResult:
+        """Authenticate *token* against the GitHub API."""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"token {token}",
+            "User-Agent": "SS360-Validator/1.0",
+        }
+        # Pace requests across findings too; bursts trip GitHub's secondary rate limits
+        if not _GITHUB_BUCKET.acquire_blocking(timeout=_GITHUB_API.timeout):
+            return ValidationResult(
+                state=ValidationState.INDETERMINATE,
+                reason="Rate limit exceeded",
+                validator_name=self.name,
+            )
         try:
-            # GitHub API endpoint to check token
-            url = "https://api.github.com/user"
-            headers = {
-                "Authorization": f"token {token}",
-                "User-Agent": "SS360-Validator/1.0",
-            }
-
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode())
-                    username = data.get("login", "unknown")
-                    return ValidationResult(
-                        state=ValidationState.VALID,
-                        evidence=f"Valid GitHub token for user: {username}",
-                        reason="Token successfully authenticated with GitHub API",
-                        validator_name=self.name,
-                    )
-                else:
-                    return ValidationResult(
-                        state=ValidationState.INVALID,
-                        reason=f"GitHub API returned status {response.status}",
-                        validator_name=self.name,
-                    )
-
-        except urllib.error.HTTPError as e:
-            if e.code == 401:
+            status, body = _GITHUB_API.get("/user", headers)
+            if status == 200:
+                data = json.loads(body.decode())
+                username = data.get("login", "unknown")
                 return ValidationResult(
-                    state=ValidationState.INVALID,
-                    reason="Token rejected by GitHub API (401 Unauthorized)",
-                    validator_name=self.name,
-                )
-            else:
-                return ValidationResult(
-                    state=ValidationState.INDETERMINATE,
-                    reason=f"GitHub API error: {e.code}",
+                    state=ValidationState.VALID,
+                    evidence=f"Valid GitHub token for user: {username}",
+                    reason="Token successfully authenticated with GitHub API",
                     validator_name=self.name,
                 )
         except Exception as e:
@@ -84,6 +178,28 @@ class GitHubPATLiveValidator:
                 validator_name=self.name,
             )
 
+        if status == 401:
+            return ValidationResult(
+                state=ValidationState.INVALID,
+                reason="Token rejected by GitHub API (401 Unauthorized)",
+                validator_name=self.name,
+            )
+        elif status >= 400:
+            return ValidationResult(
+                state=ValidationState.INDETERMINATE,
+                reason=f"GitHub API error: {status}",
+                validator_name=self.name,
+            )
+        else:
+            return ValidationResult(
+                state=ValidationState.INVALID,
+                reason=f"GitHub API returned status {status}",
+                validator_name=self.name,
+            )
+
+
+_GITHUB_BUCKET = TokenBucket(GitHubPATLiveValidator.rate_limit_qps)
+
 
 class AWSAccessKeyLiveValidator:
     """Validator that checks AWS Access Key validity via STS."""
@@ -103,37 +219,20 @@ class AWSAccessKeyLiveValidator:
             ValidationResult with state and redacted evidence
         """
         key_id = finding.get("match", "")
-        if not key_id or not key_id.startswith("AKIA"):
+        if not key_id or len(key_id) != 20 or not key_id.startswith("AKIA"):
             return ValidationResult(
                 state=ValidationState.INVALID,
                 reason="Invalid AWS Access Key ID format",
                 validator_name=self.name,
             )
 
-        try:
-            # AWS STS GetCallerIdentity endpoint
-            # Note: This is a simplified implementation - in practice you'd need
-            # AWS signature v4 signing which requires the secret key too
-            # For now, we'll just validate the format and return indeterminate
-            # A full implementation would use boto3 or implement AWS sig v4
-
-            if len(key_id) == 20 and key_id.startswith("AKIA"):
-                return ValidationResult(
-                    state=ValidationState.INDETERMINATE,
-                    reason="AWS Access Key ID format valid, but full validation requires secret key",
-                    evidence=f"Valid AKIA format: ****{key_id[-4:]}",
-                    validator_name=self.name,
-                )
-            else:
-                return ValidationResult(
-                    state=ValidationState.INVALID,
-                    reason="Invalid AWS Access Key ID format",
-                    validator_name=self.name,
-                )
-
-        except Exception as e:
-            return ValidationResult(
-                state=ValidationState.INDETERMINATE,
-                reason=f"Validation error: {str(e)}",
-                validator_name=self.name,
-            )
+        # AWS STS GetCallerIdentity would confirm the key, but that needs
+        # AWS signature v4 signing, which requires the secret key too.
+        # A full implementation would use boto3 or implement AWS sig v4;
+        # for now, we only validate the format and return indeterminate.
+        return ValidationResult(
+            state=ValidationState.INDETERMINATE,
+            reason="AWS Access Key ID format valid, but full validation requires secret key",
+            evidence=f"Valid AKIA format: ****{key_id[-4:]}",
+            validator_name=self.name,
+        )
@@ -18,6 +18,11 @@ from src.ss360.classify.rules import (
 class TestExpiryDetection:
     """Test expiry detection for JWT and Azure SAS tokens."""
 
+    # Only the payload varies between test JWTs
+    _HEADER_B64 = base64.urlsafe_b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}).encode()).rstrip(b"=").decode()
+    # Fake signature (for testing, we don't need real signature)
+    _SIGNATURE_B64 = base64.urlsafe_b64encode(b"fake_signature").rstrip(b"=").decode()
+
     def test_jwt_expired(self):
         """Test detection of expired JWT tokens."""
         # Create an expired JWT (expired 1 day ago)
@@ -126,23 +131,13 @@ class TestExpiryDetection:
 
     def _create_test_jwt(self, exp_time: datetime) -> str:
         """Create a test JWT token with specified expiry time."""
-        header = {"alg": "HS256", "typ": "JWT"}
         payload = {
             "sub": "test",
             "exp": int(exp_time.timestamp()),
             "iat": int(datetime.utcnow().timestamp()),
         }
-
-        # Encode header and payload
-        header_encoded = (
-            base64.urlsafe_b64encode(json.dumps(header).encode()).decode().rstrip("=")
-        )
-
         payload_encoded = (
-            base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+            base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
         )
 
-        # Create fake signature (for testing, we don't need real signature)
-        signature = base64.urlsafe_b64encode(b"fake_signature").decode().rstrip("=")
-
-        return f"{header_encoded}.{payload_encoded}.{signature}"
+        return f"{self._HEADER_B64}.{payload_encoded}.{self._SIGNATURE_B64}"
@@ -8,7 +8,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from datetime import datetime, timedelta
-from ss360.policy.loader import get_default_policy_config, is_waiver_active
+from ss360.policy.loader import (
+    get_default_policy_config,
+    is_waiver_active,
+    load_policy_config,
+)
 from ss360.policy.enforce import PolicyEnforcer, PolicyViolationType
 
 
@@ -55,6 +59,45 @@ class TestPolicyLoader:
             is False
         )
 
+    def test_waiver_expiry_with_utc_offset(self):
+        """Expiries with an explicit UTC offset compare correctly."""
+        waiver = {
+            "rule": "github_pat",
+            "path": "tests/*",
+            "expiry": "2099-01-01T00:00:00+00:00",
+            "reason": "Test fixtures",
+        }
+        assert is_waiver_active(waiver, "tests/test_auth.py", "github_pat") is True
+
+        waiver["expiry"] = "2000-01-01T00:00:00+00:00"
+        assert is_waiver_active(waiver, "tests/test_auth.py", "github_pat") is False
+
+    def test_cached_config_is_isolated_and_invalidated(self, tmp_path):
+        """Cached policy loads return fresh copies and notice file edits."""
+        policy_file = tmp_path / "policy.yml"
+        policy_file.write_text("version: 1\nbudgets:\n  new_findings: 3\n")
+
+        config = load_policy_config(str(policy_file))
+        config["budgets"]["new_findings"] = 99
+        assert load_policy_config(str(policy_file))["budgets"]["new_findings"] == 3
+
+        policy_file.write_text("version: 1\nbudgets:\n  new_findings: 10\n")
+        assert load_policy_config(str(policy_file))["budgets"]["new_findings"] == 10
+
+    def test_partial_sections_are_merged_with_defaults(self, tmp_path):
+        """Keys missing from a section are filled without touching the rest."""
+        policy_file = tmp_path / "policy.yml"
+        policy_file.write_text("version: 1\nbudgets:\n  max_risk_score: 70\n")
+
+        config = load_policy_config(str(policy_file))
+        assert config["budgets"] == {"max_risk_score": 70, "new_findings": 0}
+        assert config["validators"] == {"allow_network": False, "global_qps": 2.0}
+        assert config["waivers"] == []
+
+        # Defaults are copied, never shared between loads
+        config["waivers"].append({"rule": "x"})
+        assert load_policy_config(str(policy_file))["waivers"] == []
+
 
 class TestPolicyEnforcer:
     """Test policy enforcement."""
@@ -138,6 +181,38 @@ class TestPolicyEnforcer:
         assert len(result.waivers_applied) == 1
         assert len(result.violations) == 0
 
+    def test_waivers_only_apply_to_their_rule(self):
+        """Test that a waiver only filters findings of the rule it names."""
+        future_date = (datetime.now() + timedelta(days=30)).isoformat()
+        policy_config = {
+            "version": 1,
+            "validators": {"allow_network": False, "global_qps": 2.0},
+            "budgets": {"new_findings": 1, "max_risk_score": 100},
+            "waivers": [
+                {
+                    "rule": "github_pat",
+                    "path": "tests/*",
+                    "expiry": future_date,
+                    "reason": "Test fixtures",
+                }
+            ],
+        }
+
+        enforcer = PolicyEnforcer(policy_config)
+
+        findings = [
+            {"id": "github_pat", "path": "tests/test_auth.py", "line": 10, "risk_score": 30},
+            {"id": "aws_keypair", "path": "tests/test_auth.py", "line": 12, "risk_score": 30},
+        ]
+
+        result = enforcer.enforce(findings)
+
+        assert result.passed is True
+        assert [w["finding"] for w in result.waivers_applied] == [
+            "github_pat:tests/test_auth.py"
+        ]
+        assert result.summary["filtered_findings"] == 1
+
     def test_no_violations(self):
         """Test case with no policy violations."""
         policy_config = {
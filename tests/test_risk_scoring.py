@@ -4,15 +4,18 @@ Tests for risk scoring system.
 """
 import sys
 import os
+import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from ss360.risk.score import (
     calculate_risk_score,
+    calculate_risk_scores,
     get_risk_level,
     risk_summary,
     RiskLevel,
     BASE_RISK_SCORES,
+    _get_path_modifier,
 )
 
 
@@ -71,6 +74,13 @@ class TestRiskScoring:
 
         assert prod_score > normal_score > test_score
 
+    def test_path_indicator_priority(self):
+        """Earlier indicators win regardless of where they appear in the path."""
+        assert _get_path_modifier("tests/production_config.py") == 1.2
+        assert _get_path_modifier("src/DEMOCK.py") == 0.6  # "mock" outranks "demo"
+        assert _get_path_modifier("src/utils.py") == 1.0
+        assert _get_path_modifier("") == 1.0
+
     def test_risk_levels(self):
         """Test risk level categorization."""
         assert get_risk_level(90) == RiskLevel.CRITICAL
@@ -98,6 +108,36 @@ class TestRiskScoring:
         assert "validation_modifier" in factors
         assert "path_modifier" in factors
 
+    def test_batch_scores_match_single_scores(self):
+        """Test batch scoring matches scoring findings one at a time."""
+        findings = [
+            {"id": "github_pat", "path": "config/production.py", "category": "actual"},
+            {"id": "aws_keypair", "path": "tests/fixtures.py", "category": "test"},
+            {"id": "slack_webhook", "path": "README.md", "history_age_days": 400},
+            {"id": "unknown_type", "path": "src/app.py"},
+        ]
+        validation_results = [
+            [{"state": "valid"}],
+            [],
+            [{"state": "invalid"}],
+            [{"state": "indeterminate"}],
+        ]
+        repo_context = {"is_public": True}
+
+        expected = [
+            calculate_risk_score(f, v, repo_context)
+            for f, v in zip(findings, validation_results)
+        ]
+        assert calculate_risk_scores(findings, validation_results, repo_context) == expected
+        assert calculate_risk_scores(findings) == [calculate_risk_score(f) for f in findings]
+        assert calculate_risk_scores([]) == []
+
+    def test_batch_scores_reject_mismatched_validation_results(self):
+        """Test batch scoring refuses validation results of the wrong length."""
+        findings = [{"id": "github_pat", "path": "a.py"}, {"id": "aws_keypair", "path": "b.py"}]
+        with pytest.raises(ValueError):
+            calculate_risk_scores(findings, [[{"state": "valid"}]])
+
 
 def test_github_pat_detector():
     """Test GitHub PAT detector patterns."""
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MIT
+"""
+Tests for SARIF export.
+"""
+import io
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ss360.sarif.export import build_sarif, dump_sarif, stream_sarif
+
+
+def _report(root):
+    return {
+        "root": str(root),
+        "findings": [
+            {"kind": "GitHub PAT", "path": str(root / "a.py"), "line": 3, "reason": "token"},
+            {"kind": "AWS Key", "path": str(root / "b.py"), "line": 0, "category": "actual"},
+            {"kind": "GitHub PAT", "path": str(root / "a.py"), "line": 9, "is_secret": False},
+        ],
+    }
+
+
+def test_build_sarif_indexes_rules_by_kind(tmp_path):
+    """Each kind becomes one rule and results point at it by index."""
+    run = build_sarif(_report(tmp_path))["runs"][0]
+
+    assert [r["id"] for r in run["tool"]["driver"]["rules"]] == ["GitHub PAT", "AWS Key"]
+    assert [r["ruleIndex"] for r in run["results"]] == [0, 1, 0]
+    assert run["results"][2]["level"] == "warning"
+    uri = run["results"][0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+    assert uri == "a.py"
+
+
+def test_dump_sarif_writes_valid_json(tmp_path):
+    """The written file decodes back to the built SARIF document."""
+    report = _report(tmp_path)
+    out = dump_sarif(report, tmp_path / "out" / "findings.sarif")
+
+    assert json.loads(out.read_text(encoding="utf-8")) == build_sarif(report)
+
+
+def test_stream_sarif_matches_built_document(tmp_path):
+    """Streaming writes the same document as build_sarif."""
+    report = _report(tmp_path)
+    buf = io.BytesIO()
+    stream_sarif(report, buf)
+
+    assert json.loads(buf.getvalue()) == build_sarif(report)
+
+
+def test_stream_sarif_without_findings(tmp_path):
+    buf = io.BytesIO()
+    stream_sarif({"root": str(tmp_path), "findings": []}, buf)
+
+    assert json.loads(buf.getvalue()) == build_sarif({"root": str(tmp_path)})
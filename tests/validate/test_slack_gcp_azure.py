@@ -273,6 +273,20 @@ class TestAzureSASLiveValidator:
         assert result.state == ValidationState.INVALID
         assert "Invalid Azure SAS token format" in result.reason
 
+    def test_invalid_sas_token_lookalike_domain(self):
+        """Test that the Azure domain must be the host suffix."""
+        validator = AzureSASLiveValidator()
+        invalid_sas = "https://acct.blob.core.windows.net.example.com/c/b?se=2023-12-31T23%3A59%3A59Z&sig=abcdef1234567890"
+
+        result = validator.validate({"match": invalid_sas})
+
+        assert result.state == ValidationState.INVALID
+        assert "Invalid Azure SAS token format" in result.reason
+
+        # A port does not hide the host
+        valid_sas = "https://acct.blob.core.windows.net:443/c/b?se=2023-12-31T23%3A59%3A59Z&sig=abcdef1234567890"
+        assert validator._is_valid_sas_format(valid_sas)
+
     def test_invalid_sas_token_missing_required_params(self):
         """Test validation with missing required SAS parameters."""
         validator = AzureSASLiveValidator()